@@ -5,27 +5,17 @@ This is the main application that demonstrates Gödel numbering and self-referen
 in mathematical logic through an interactive web interface.
 """
 
+import sys
 import streamlit as st
-import pandas as pd
-from typing import Dict
 
-# Import our modules
+# Import our modules (the plotly-backed visualizer is imported by
+# get_visualizer, on first use in the Interactive Demo tab)
 from godel_encoder import GodelEncoder, SimplifiedGodelEncoder
 from paradox_generator import ParadoxGenerator
-from visualizer import GodelVisualizer
-from examples import GodelExamples
 import utils
 
-# Page configuration
-st.set_page_config(
-    page_title="Gödel Numbering Playground",
-    page_icon="",
-    layout="wide",
-    initial_sidebar_state="expanded"
-)
-
 # Custom CSS for better styling
-st.markdown("""
+_CSS = """
 <style>
     .main-header {
         font-size: 3rem;
@@ -65,17 +55,107 @@ st.markdown("""
         border: 1px solid #dee2e6;
     }
 </style>
-""", unsafe_allow_html=True)
+"""
+
+# Gödel numbers of long statements exceed Python's default int-to-str digit limit
+if hasattr(sys, "set_int_max_str_digits"):
+    sys.set_int_max_str_digits(0)
+
+# Page configuration
+st.set_page_config(
+    page_title="Gödel Numbering Playground",
+    page_icon="",
+    layout="wide",
+    initial_sidebar_state="expanded"
+)
+
+
+# The encoders, paradox generators and visualizer hold no per-user state, so a
+# single instance of each is shared by every session.
+@st.cache_resource
+def get_encoder(simplified: bool) -> GodelEncoder:
+    """Shared encoder for the selected mode."""
+    return SimplifiedGodelEncoder() if simplified else GodelEncoder()
+
+
+@st.cache_resource
+def get_paradox_generator(simplified: bool) -> ParadoxGenerator:
+    """Shared paradox generator built on the encoder for the selected mode."""
+    return ParadoxGenerator(get_encoder(simplified))
+
+
+@st.cache_resource
+def get_visualizer():
+    """Shared visualizer; plotly is imported on first use."""
+    from visualizer import GodelVisualizer
+    
+    return GodelVisualizer()
+
+
+@st.cache_data(max_entries=512)
+def cached_encode(variant: str, statement: str):
+    """Encode a statement, memoized across reruns and sessions."""
+    return get_encoder(variant == "simplified").encode_statement(statement)
+
+
+@st.cache_data(max_entries=512)
+def cached_decode(variant: str, godel_number: int):
+    """Decode a Gödel number, memoized across reruns and sessions."""
+    return get_encoder(variant == "simplified").decode_number(godel_number)
+
+
+@st.cache_data(max_entries=512)
+def cached_number_str(variant: str, statement: str) -> str:
+    """Comma-grouped Gödel number of a statement, formatted once per input."""
+    godel_number, _ = cached_encode(variant, statement)
+    return f"{godel_number:,}"
+
+
+# Figures are keyed on (statement, variant) so re-rendering an unchanged demo
+# skips figure construction and serialization entirely.
+@st.cache_data(max_entries=128)
+def _tree_fig(statement: str, variant: str, factors: tuple, title: str):
+    """Prime factorization tree; factors is a sorted tuple of (prime, power)."""
+    return get_visualizer().create_prime_factorization_tree(dict(factors), title)
+
+
+@st.cache_data(max_entries=128)
+def _mapping_fig(statement: str, variant: str, title: str):
+    """Symbol to number mapping chart for a statement."""
+    _, encoding_details = cached_encode(variant, statement)
+    return get_visualizer().create_symbol_mapping_chart(encoding_details, title)
+
+
+@st.cache_data(max_entries=128)
+def _flow_fig(statement: str, variant: str):
+    """Encoding process flow diagram for a statement."""
+    _, encoding_details = cached_encode(variant, statement)
+    return get_visualizer().create_encoding_process_flow(encoding_details)
 
-# Initialize session state
-if 'encoder' not in st.session_state:
-    st.session_state.encoder = SimplifiedGodelEncoder()
-if 'paradox_generator' not in st.session_state:
-    st.session_state.paradox_generator = ParadoxGenerator(st.session_state.encoder)
-if 'visualizer' not in st.session_state:
-    st.session_state.visualizer = GodelVisualizer()
-if 'examples' not in st.session_state:
-    st.session_state.examples = GodelExamples()
+
+@st.cache_resource(show_spinner=False)
+def _inject_css() -> bool:
+    """Inject the custom CSS; later reruns replay the cached element."""
+    st.markdown(_CSS, unsafe_allow_html=True)
+    return True
+
+
+@st.cache_data
+def _demo_statements() -> tuple:
+    """Demo statements for the sidebar selectbox."""
+    return tuple(utils.create_demo_statements())
+
+
+# Custom CSS for better styling, injected through a cached helper
+_inject_css()
+
+# The mode comes from the Settings checkbox at the bottom of the sidebar. Reading
+# it through the widget key lets the code above the checkbox use the new value
+# in the same rerun.
+use_simplified = st.session_state.get('use_simplified', True)
+variant = "simplified" if use_simplified else "full"
+encoder = get_encoder(use_simplified)
+paradox_generator = get_paradox_generator(use_simplified)
 
 # Main header
 st.markdown('<h1 class="main-header">Gödel Numbering Playground</h1>', unsafe_allow_html=True)
@@ -88,30 +168,33 @@ st.markdown("""
 </div>
 """, unsafe_allow_html=True)
 
+# Button callbacks run before the rerun they trigger, so state they set is
+# picked up without a second st.rerun()
+def _try_example():
+    """Load the selected sidebar example into the Encode tab."""
+    st.session_state.current_statement = st.session_state.selected_example
+    st.session_state.active_tab = "Encode"
+
+
+def _set_demo_statement(statement: str):
+    """Fill the Interactive Demo input with a quick example."""
+    st.session_state.demo_statement = statement
+
+
 # Sidebar
 with st.sidebar:
     st.header("Quick Examples")
     
     # Quick example buttons
-    demo_statements = utils.create_demo_statements()
-    selected_example = st.selectbox("Choose a demo statement:", demo_statements)
-    
-    if st.button("Try This Example"):
-        st.session_state.current_statement = selected_example
-        st.session_state.active_tab = "Encode"
-        st.rerun()
+    demo_statements = _demo_statements()
+    st.selectbox("Choose a demo statement:", demo_statements, key="selected_example")
+    st.button("Try This Example", on_click=_try_example)
     
     st.markdown("---")
     
     # Symbol reference table
     st.header("Symbol Reference")
-    symbol_map = st.session_state.encoder.get_symbol_table()
-    
-    # Create a compact symbol table
-    symbol_df = pd.DataFrame([
-        {"Symbol": symbol, "Code": code} 
-        for symbol, code in symbol_map.items()
-    ])
+    symbol_df = encoder.symbol_table_df
     
     st.dataframe(symbol_df, use_container_width=True)
     
@@ -119,24 +202,15 @@ with st.sidebar:
     
     # Settings
     st.header("Settings")
-    use_simplified = st.checkbox("Use Simplified Mode", value=True, 
-                                help="Use smaller numbers for easier demonstration")
-    
-    if use_simplified != isinstance(st.session_state.encoder, SimplifiedGodelEncoder):
-        if use_simplified:
-            st.session_state.encoder = SimplifiedGodelEncoder()
-        else:
-            st.session_state.encoder = GodelEncoder()
-        st.session_state.paradox_generator = ParadoxGenerator(st.session_state.encoder)
-        st.rerun()
+    st.checkbox("Use Simplified Mode", value=True, key="use_simplified",
+                help="Use smaller numbers for easier demonstration")
 
-# Main content tabs
-tab1, tab2, tab3, tab4 = st.tabs([
-    "Encode", "Decode", "Paradoxes", "Interactive Demo"
-])
+# Main content tabs. Only the active tab's body runs on a rerun, unlike st.tabs
+# which executes every tab every time.
 
 # Tab 1: Encode
-with tab1:
+def render_tab_encode():
+    """Render the Encode tab."""
     st.header("Encode Logical Statements to Gödel Numbers")
     
     col1, col2 = st.columns([2, 1])
@@ -144,20 +218,23 @@ with tab1:
     with col1:
         # Input section
         st.subheader("Input Statement")
-        statement = st.text_input(
-            "Enter a logical statement:",
-            value=st.session_state.get('current_statement', '0=0'),
-            placeholder="e.g., 0=0, S(0), x+0=x, ∀x(x=x)",
-            help="Use supported symbols: 0, S, +, ×, =, (, ), ¬, →, ∀, ∃, a-z variables"
-        )
+        # A form reruns the script once on submit rather than on every edit
+        with st.form("encode_form"):
+            statement = st.text_input(
+                "Enter a logical statement:",
+                value=st.session_state.get('current_statement', '0=0'),
+                placeholder="e.g., 0=0, S(0), x+0=x, ∀x(x=x)",
+                help="Use supported symbols: 0, S, +, ×, =, (, ), ¬, →, ∀, ∃, a-z variables"
+            )
+            submitted = st.form_submit_button("Encode Statement", type="primary")
         
-        if st.button("Encode Statement", type="primary"):
+        if submitted:
             if statement.strip():
                 try:
-                    godel_number, encoding_details = st.session_state.encoder.encode_statement(statement)
+                    godel_number, encoding_details = cached_encode(variant, statement)
                     st.session_state.current_encoding = encoding_details
                     st.session_state.current_godel_number = godel_number
-                    st.success(f"Successfully encoded! Gödel number: {godel_number:,}")
+                    st.success(f"Successfully encoded! Gödel number: {cached_number_str(variant, statement)}")
                 except Exception as e:
                     st.error(f"Encoding error: {str(e)}")
             else:
@@ -174,33 +251,34 @@ with tab1:
         5. **Multiply** all results together
         """)
         
-        # Size estimator
+        # Size estimator; the digit count comes from log10, so the number
+        # itself never has to be multiplied out
         if statement:
-            try:
-                size_estimate = utils.estimate_godel_number_size(len(statement))
-                st.info(f"**Estimated size:** {size_estimate['digits']} digits")
-            except:
-                pass
+            digits = int(encoder.encode_log10(statement)) + 1
+            st.info(f"**Estimated size:** {digits:,} digits")
 
 # Tab 2: Decode
-with tab2:
+def render_tab_decode():
+    """Render the Decode tab."""
     st.header("Decode Gödel Numbers to Statements")
     
     col1, col2 = st.columns([2, 1])
     
     with col1:
         st.subheader("Input Gödel Number")
-        godel_input = st.text_input(
-            "Enter a Gödel number to decode:",
-            placeholder="e.g., 51840, 123456789",
-            help="Enter a natural number to see what statement it represents"
-        )
+        with st.form("decode_form"):
+            godel_input = st.text_input(
+                "Enter a Gödel number to decode:",
+                placeholder="e.g., 51840, 123456789",
+                help="Enter a natural number to see what statement it represents"
+            )
+            submitted = st.form_submit_button("Decode Number", type="primary")
         
-        if st.button("Decode Number", type="primary"):
+        if submitted:
             if godel_input.strip():
                 try:
                     godel_number = int(godel_input)
-                    decoded_statement, decoding_details = st.session_state.encoder.decode_number(godel_number)
+                    decoded_statement, decoding_details = cached_decode(variant, godel_number)
                     st.session_state.current_decoding = decoding_details
                     st.session_state.current_decoded_statement = decoded_statement
                     st.success(f"Successfully decoded! Statement: `{decoded_statement}`")
@@ -212,7 +290,8 @@ with tab2:
                 st.warning("Please enter a number to decode.")
 
 # Tab 3: Paradoxes
-with tab3:
+def render_tab_paradoxes():
+    """Render the Paradoxes tab."""
     st.header("Self-Reference and Paradoxes")
     
     st.markdown("""
@@ -241,14 +320,15 @@ with tab3:
         
         if st.button("Generate Paradox", type="primary"):
             try:
-                paradox_data = st.session_state.paradox_generator.generate_self_referential_statement(paradox_type)
+                paradox_data = paradox_generator.generate_self_referential_statement(paradox_type)
                 st.session_state.current_paradox = paradox_data
                 st.success("Paradox generated successfully!")
             except Exception as e:
                 st.error(f"Error generating paradox: {str(e)}")
 
 # Tab 4: Interactive Demo
-with tab4:
+def render_tab_demo():
+    """Render the Interactive Demo tab."""
     st.header("Interactive Gödel Numbering Demo")
     
     st.markdown("""
@@ -257,34 +337,38 @@ with tab4:
     """)
     
     # Demo statement input
+    st.session_state.setdefault('demo_statement', "x=0")
     col1, col2 = st.columns([3, 1])
     
     with col1:
-        demo_statement = st.text_input(
-            "Enter a logical statement:",
-            value="x=0",
-            placeholder="Try: 0=0, S(0), x+0=x, ∀x(x=x)"
-        )
+        with st.form("demo_form"):
+            demo_statement = st.text_input(
+                "Enter a logical statement:",
+                key="demo_statement",
+                placeholder="Try: 0=0, S(0), x+0=x, ∀x(x=x)"
+            )
+            submitted = st.form_submit_button("Start Interactive Demo", type="primary")
     
     with col2:
         st.markdown("**Quick Examples:**")
-        if st.button("0=0", key="ex1"):
-            demo_statement = "0=0"
-            st.rerun()
-        if st.button("S(0)", key="ex2"):
-            demo_statement = "S(0)"
-            st.rerun()
-        if st.button("x=0", key="ex3"):
-            demo_statement = "x=0"
-            st.rerun()
+        st.button("0=0", key="ex1", on_click=_set_demo_statement, args=("0=0",))
+        st.button("S(0)", key="ex2", on_click=_set_demo_statement, args=("S(0)",))
+        st.button("x=0", key="ex3", on_click=_set_demo_statement, args=("x=0",))
     
-    if st.button("Start Interactive Demo", type="primary"):
+    if submitted:
         if demo_statement.strip():
             try:
                 # Encode the statement
-                godel_number, encoding_details = st.session_state.encoder.encode_statement(demo_statement)
+                godel_number, encoding_details = cached_encode(variant, demo_statement)
+                gn_str = cached_number_str(variant, demo_statement)
+                st.session_state.demo_cache = {
+                    'stmt': demo_statement,
+                    'variant': variant,
+                    'n': godel_number,
+                    'details': encoding_details
+                }
                 
-                st.success(f"Successfully encoded: '{demo_statement}' → {godel_number:,}")
+                st.success(f"Successfully encoded: '{demo_statement}' → {gn_str}")
                 
                 # Step-by-step breakdown
                 st.subheader("Step-by-Step Breakdown")
@@ -295,24 +379,24 @@ with tab4:
                     st.markdown("**Statement Analysis:**")
                     st.markdown(f"- **Statement:** `{demo_statement}`")
                     st.markdown(f"- **Length:** {len(demo_statement)} symbols")
-                    st.markdown(f"- **Final Gödel Number:** {godel_number:,}")
+                    st.markdown(f"- **Final Gödel Number:** {gn_str}")
                     
                     # Symbol breakdown table
                     st.markdown("**Symbol Breakdown:**")
-                    symbol_data = []
+                    symbol_cols = {
+                        "Position": [], "Symbol": [], "Code": [],
+                        "Prime": [], "Power": [], "Contribution": []
+                    }
                     for item in encoding_details['symbol_codes']:
-                        contribution = item['prime'] ** item['code']
-                        symbol_data.append({
-                            "Position": item['position'],
-                            "Symbol": item['symbol'],
-                            "Code": item['code'],
-                            "Prime": item['prime'],
-                            "Power": item['code'],
-                            "Contribution": f"{contribution:,}"
-                        })
+                        symbol_cols["Position"].append(item['position'])
+                        symbol_cols["Symbol"].append(item['symbol'])
+                        symbol_cols["Code"].append(item['code'])
+                        symbol_cols["Prime"].append(item['prime'])
+                        symbol_cols["Power"].append(item['code'])
+                        # Arrow can't hold ints wider than 64 bits, so keep the string form
+                        symbol_cols["Contribution"].append(f"{item['contribution']:,}")
                     
-                    symbol_df = pd.DataFrame(symbol_data)
-                    st.dataframe(symbol_df, use_container_width=True)
+                    st.table(symbol_cols)
                 
                 with col2:
                     st.markdown("**Mathematical Process:**")
@@ -321,7 +405,7 @@ with tab4:
                     # Show the calculation
                     calculation_steps = []
                     for item in encoding_details['symbol_codes']:
-                        step = f"{item['prime']}^{item['code']} = {item['prime'] ** item['code']:,}"
+                        step = f"{item['prime']}^{item['code']} = {item['contribution']:,}"
                         calculation_steps.append(step)
                     
                     st.markdown("**Steps:**")
@@ -329,73 +413,95 @@ with tab4:
                         st.markdown(f"{i+1}. {step}")
                     
                     st.markdown("**Final:** " + " × ".join(calculation_steps))
-                    st.markdown(f"**Result:** {godel_number:,}")
+                    st.markdown(f"**Result:** {gn_str}")
                 
                 # Prime factorization visualization
                 st.subheader("Prime Factorization Tree")
-                tree_fig = st.session_state.visualizer.create_prime_factorization_tree(
-                    encoding_details['prime_factors'],
-                    f"Prime Factorization of '{demo_statement}' → {godel_number:,}"
+                tree_fig = _tree_fig(
+                    demo_statement,
+                    variant,
+                    tuple(sorted(encoding_details['prime_factors'].items())),
+                    f"Prime Factorization of '{demo_statement}' → {gn_str}"
                 )
                 st.plotly_chart(tree_fig, use_container_width=True)
                 
                 # Symbol mapping chart
                 st.subheader("Symbol to Number Mapping")
-                mapping_fig = st.session_state.visualizer.create_symbol_mapping_chart(
-                    encoding_details,
+                mapping_fig = _mapping_fig(
+                    demo_statement,
+                    variant,
                     f"Symbol Mapping for '{demo_statement}'"
                 )
                 st.plotly_chart(mapping_fig, use_container_width=True)
                 
                 # Process flow
                 st.subheader("Encoding Process Flow")
-                flow_fig = st.session_state.visualizer.create_encoding_process_flow(encoding_details)
+                flow_fig = _flow_fig(demo_statement, variant)
                 st.plotly_chart(flow_fig, use_container_width=True)
                 
-                # Interactive exploration
-                st.subheader("Interactive Exploration")
-                
-                col1, col2 = st.columns([1, 1])
-                
-                with col1:
-                    st.markdown("**Try decoding this number back:**")
-                    if st.button("Decode Back to Statement"):
-                        try:
-                            decoded_statement, decoding_details = st.session_state.encoder.decode_number(godel_number)
-                            if decoded_statement == demo_statement:
-                                st.success(f"Perfect! Decoded back to: '{decoded_statement}'")
-                            else:
-                                st.warning(f"Decoded to: '{decoded_statement}' (should be '{demo_statement}')")
-                        except Exception as e:
-                            st.error(f"Decoding error: {str(e)}")
-                
-                with col2:
-                    st.markdown("**Compare with other statements:**")
-                    compare_statements = ["0=0", "S(0)", "x=0", "0+0=0"]
-                    if demo_statement not in compare_statements:
-                        compare_statements.append(demo_statement)
-                    
-                    selected_compare = st.selectbox("Choose to compare:", compare_statements)
-                    if st.button("Compare"):
-                        try:
-                            compare_number, compare_details = st.session_state.encoder.encode_statement(selected_compare)
-                            st.info(f"'{selected_compare}' → {compare_number:,}")
-                            
-                            # Show size comparison
-                            if compare_number > godel_number:
-                                st.markdown(f"**'{selected_compare}' is {compare_number/godel_number:.1f}x larger**")
-                            elif compare_number < godel_number:
-                                st.markdown(f"**'{demo_statement}' is {godel_number/compare_number:.1f}x larger**")
-                            else:
-                                st.markdown("**Both statements have the same Gödel number**")
-                        except Exception as e:
-                            st.error(f"Comparison error: {str(e)}")
-                
             except Exception as e:
                 st.error(f"Demo error: {str(e)}")
                 st.info("Try a simpler statement like '0=0' or 'x=0'")
         else:
             st.warning("Please enter a statement for the demo.")
+    
+    # Interactive exploration of the last encoded statement, kept across reruns
+    demo_cache = st.session_state.get('demo_cache')
+    if demo_cache:
+        st.subheader("Interactive Exploration")
+        
+        col1, col2 = st.columns([1, 1])
+        
+        with col1:
+            st.markdown(f"**Try decoding `{demo_cache['stmt']}` back:**")
+            if st.button("Decode Back to Statement"):
+                try:
+                    decoded_statement, decoding_details = cached_decode(demo_cache['variant'], demo_cache['n'])
+                    if decoded_statement == demo_cache['stmt']:
+                        st.success(f"Perfect! Decoded back to: '{decoded_statement}'")
+                    else:
+                        st.warning(f"Decoded to: '{decoded_statement}' (should be '{demo_cache['stmt']}')")
+                except Exception as e:
+                    st.error(f"Decoding error: {str(e)}")
+        
+        with col2:
+            st.markdown("**Compare with other statements:**")
+            compare_statements = ["0=0", "S(0)", "x=0", "0+0=0"]
+            if demo_cache['stmt'] not in compare_statements:
+                compare_statements.append(demo_cache['stmt'])
+            
+            selected_compare = st.selectbox("Choose to compare:", compare_statements)
+            if st.button("Compare"):
+                try:
+                    godel_number = demo_cache['n']
+                    compare_number, compare_details = cached_encode(demo_cache['variant'], selected_compare)
+                    st.info(f"'{selected_compare}' → {cached_number_str(demo_cache['variant'], selected_compare)}")
+                    
+                    # Show size comparison
+                    if compare_number > godel_number:
+                        st.markdown(f"**'{selected_compare}' is {utils.format_size_ratio(compare_number, godel_number)}x larger**")
+                    elif compare_number < godel_number:
+                        st.markdown(f"**'{demo_cache['stmt']}' is {utils.format_size_ratio(godel_number, compare_number)}x larger**")
+                    else:
+                        st.markdown("**Both statements have the same Gödel number**")
+                except Exception as e:
+                    st.error(f"Comparison error: {str(e)}")
+
+TABS = {
+    "Encode": render_tab_encode,
+    "Decode": render_tab_decode,
+    "Paradoxes": render_tab_paradoxes,
+    "Interactive Demo": render_tab_demo,
+}
+
+active_tab = st.radio(
+    "Section",
+    list(TABS),
+    horizontal=True,
+    key="active_tab",
+    label_visibility="collapsed"
+)
+TABS[active_tab]()
 
 # Footer
 st.markdown("---")
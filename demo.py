@@ -5,19 +5,73 @@ This script demonstrates the core functionality without requiring Streamlit.
 Run this to see how Gödel numbering works with simple examples.
 """
 
+import contextlib
+import functools
+import io
+import math
+import os
+import sys
+import traceback
+from concurrent.futures import ProcessPoolExecutor
+
+# gmpy2 converts huge integers to decimal much faster than str()
+try:
+    from gmpy2 import mpz
+except ImportError:  # pragma: no cover - gmpy2 is optional
+    mpz = None
+
 from godel_encoder import SimplifiedGodelEncoder
 from paradox_generator import ParadoxGenerator
 from visualizer import GodelVisualizer
-from examples import GodelExamples
+from examples import EXAMPLES_SINGLETON
 import utils
 
+@functools.lru_cache(maxsize=None)
+def _get_encoder():
+    """Shared encoder for all demos (one per process).
+    
+    The encoder memoizes its own results, so statements used by several demos
+    (such as "x=0") are only encoded once.
+    """
+    return SimplifiedGodelEncoder()
+
+# Prime powers longer than this are printed by size instead of in full
+MAX_EXACT_DIGITS = 64
+
+def _fmt_int(n):
+    """Format an integer with thousands separators, like f"{n:,}"."""
+    digits = mpz(n).digits(10) if mpz is not None else str(n)
+    sign, digits = ("-", digits[1:]) if digits.startswith("-") else ("", digits)
+    head = len(digits) % 3 or 3
+    groups = [digits[:head]] + [digits[i:i + 3] for i in range(head, len(digits), 3)]
+    return sign + ",".join(groups)
+
+def _format_prime_power(prime, code, value):
+    """Format prime^code in full when short, otherwise as its order of magnitude."""
+    digits = int(code * math.log10(prime)) + 1
+    if digits <= MAX_EXACT_DIGITS:
+        return _fmt_int(value)
+    return f"~10^{digits - 1} ({digits} digits)"
+
+def _print_encoding(statement, godel_number, encoding_details):
+    """Print an encoded statement with its symbol breakdown."""
+    print(f"\nStatement: '{statement}'")
+    print(f"Gödel Number: {_fmt_int(godel_number)}")
+    print(f"Length: {len(statement)} symbols")
+    print(f"Prime Factors: {encoding_details['prime_factors']}")
+    
+    # Show symbol breakdown, written in one go rather than a print per symbol
+    print("   Symbol Breakdown:")
+    sys.stdout.write("".join(
+        f"     Position {symbol_info['position']}: '{symbol_info['symbol']}' → {symbol_info['code']} → Prime {symbol_info['prime']} → {_format_prime_power(symbol_info['prime'], symbol_info['code'], symbol_info['contribution'])}\n"
+        for symbol_info in encoding_details['symbol_codes']
+    ))
+
 def demo_basic_encoding():
     """Demonstrate basic encoding functionality."""
     print("Basic Encoding Demo")
     print("=" * 50)
     
-    encoder = SimplifiedGodelEncoder()
-    
     # Test statements
     test_statements = [
         "0=0",
@@ -27,22 +81,18 @@ def demo_basic_encoding():
         "∀x(x=x)"
     ]
     
+    # These are microsecond encodes, so they run in-process, in one batch.
+    # Statements the encoder would reject are reported up front and left out
+    # of the batch, so one bad statement does not fail the rest.
+    encoder = _get_encoder()
+    errors = {statement: encoder.statement_error(statement) for statement in test_statements}
+    results = iter(encoder.batch_encode([s for s in test_statements if not errors[s]]))
     for statement in test_statements:
-        try:
-            godel_number, encoding_details = encoder.encode_statement(statement)
-            print(f"\nStatement: '{statement}'")
-            print(f"Gödel Number: {godel_number:,}")
-            print(f"Length: {len(statement)} symbols")
-            print(f"Prime Factors: {encoding_details['prime_factors']}")
-            
-            # Show symbol breakdown
-            print("   Symbol Breakdown:")
-            for symbol_info in encoding_details['symbol_codes']:
-                contribution = symbol_info['prime'] ** symbol_info['code']
-                print(f"     Position {symbol_info['position']}: '{symbol_info['symbol']}' → {symbol_info['code']} → Prime {symbol_info['prime']} → {contribution:,}")
-                
-        except Exception as e:
-            print(f"Error encoding '{statement}': {e}")
+        if errors[statement]:
+            print(f"Error encoding '{statement}': {errors[statement]}")
+            continue
+        godel_number, encoding_details = next(results)
+        _print_encoding(statement, godel_number, encoding_details)
     
     print("\n" + "=" * 50)
 
@@ -51,68 +101,71 @@ def demo_decoding():
     print("Decoding Demo")
     print("=" * 50)
     
-    encoder = SimplifiedGodelEncoder()
+    encoder = _get_encoder()
     
     # Encode a statement first
     statement = "x=0"
     godel_number, _ = encoder.encode_statement(statement)
     
     print(f"Original Statement: '{statement}'")
-    print(f"Gödel Number: {godel_number:,}")
+    print(f"Gödel Number: {_fmt_int(godel_number)}")
     
-    # Now decode it
-    try:
-        decoded_statement, decoding_details = encoder.decode_number(godel_number)
-        print(f"Decoded Statement: '{decoded_statement}'")
-        print(f"Match: {'Yes' if statement == decoded_statement else 'No'}")
-        print(f"Decoding Details:")
-        print(f"   Prime Factors: {decoding_details['prime_factors']}")
-        print(f"   Symbol Reconstruction:")
-        for symbol_info in decoding_details['decoded_symbols']:
-            print(f"     Position {symbol_info['position']}: Prime {symbol_info['prime']}^{symbol_info['power']} → '{symbol_info['symbol']}'")
-            
-    except Exception as e:
-        print(f"Error decoding: {e}")
+    # Now decode it; a number the encoder just produced always decodes
+    decoded_statement, decoding_details = encoder.decode_number(godel_number)
+    print(f"Decoded Statement: '{decoded_statement}'")
+    print(f"Match: {'Yes' if statement == decoded_statement else 'No'}")
+    print(f"Decoding Details:")
+    print(f"   Prime Factors: {decoding_details['prime_factors']}")
+    print(f"   Symbol Reconstruction:")
+    sys.stdout.write("".join(
+        f"     Position {symbol_info['position']}: Prime {symbol_info['prime']}^{symbol_info['power']} → '{symbol_info['symbol']}'\n"
+        for symbol_info in decoding_details['decoded_symbols']
+    ))
     
     print("\n" + "=" * 50)
 
+def _print_paradox(paradox_gen, paradox_type):
+    """Generate, print and analyze one paradox template."""
+    paradox_data = paradox_gen.generate_self_referential_statement(paradox_type)
+    
+    if 'error' in paradox_data:
+        print(f"Error with {paradox_type}: {paradox_data['error']}")
+        return
+    
+    print(f"\n{paradox_data['template']['name']}")
+    print(f"Base Statement: '{paradox_data['base_statement']}'")
+    print(f"Base Gödel Number: {_fmt_int(paradox_data['base_godel_number'])}")
+    
+    if paradox_data['has_self_reference']:
+        print(f"Self-Referential: '{paradox_data['self_referential_statement']}'")
+    
+    print(f"Explanation: {paradox_data['template']['explanation']}")
+    
+    # Analyze the paradox
+    analysis = paradox_gen.analyze_paradox(paradox_data)
+    if 'logical_implications' in analysis:
+        print("   Logical Implications:")
+        for implication in analysis['logical_implications']:
+            print(f"     - {implication}")
+
 def demo_paradoxes():
     """Demonstrate paradox generation."""
     print("Paradox Generation Demo")
     print("=" * 50)
     
-    encoder = SimplifiedGodelEncoder()
+    encoder = _get_encoder()
     paradox_gen = ParadoxGenerator(encoder)
     
     # Generate different types of paradoxes
     paradox_types = ["liar_paradox", "quine", "provability"]
     
+    # Unknown template names are the only thing generation raises for;
+    # encoding failures come back in the result and are printed there
     for paradox_type in paradox_types:
-        try:
-            paradox_data = paradox_gen.generate_self_referential_statement(paradox_type)
-            
-            if 'error' not in paradox_data:
-                print(f"\n{paradox_data['template']['name']}")
-                print(f"Base Statement: '{paradox_data['base_statement']}'")
-                print(f"Base Gödel Number: {paradox_data['base_godel_number']:,}")
-                
-                if paradox_data['has_self_reference']:
-                    print(f"Self-Referential: '{paradox_data['self_referential_statement']}'")
-                
-                print(f"Explanation: {paradox_data['explanation']}")
-                
-                # Analyze the paradox
-                analysis = paradox_gen.analyze_paradox(paradox_data)
-                if 'logical_implications' in analysis:
-                    print("   Logical Implications:")
-                    for implication in analysis['logical_implications']:
-                        print(f"     - {implication}")
-                
-            else:
-                print(f"Error with {paradox_type}: {paradox_data['error']}")
-                
-        except Exception as e:
-            print(f"Error generating {paradox_type}: {e}")
+        if paradox_type not in paradox_gen.paradox_templates:
+            print(f"Error generating {paradox_type}: Unknown template: {paradox_type}")
+            continue
+        _print_paradox(paradox_gen, paradox_type)
     
     print("\n" + "=" * 50)
 
@@ -121,7 +174,7 @@ def demo_visualizations():
     print("Visualization Demo")
     print("=" * 50)
     
-    encoder = SimplifiedGodelEncoder()
+    encoder = _get_encoder()
     visualizer = GodelVisualizer()
     
     # Create a sample statement
@@ -129,7 +182,7 @@ def demo_visualizations():
     godel_number, encoding_details = encoder.encode_statement(statement)
     
     print(f"Statement: '{statement}'")
-    print(f"Gödel Number: {godel_number:,}")
+    print(f"Gödel Number: {_fmt_int(godel_number)}")
     
     # Create visualizations
     try:
@@ -163,7 +216,7 @@ def demo_examples():
     print("Examples Collection Demo")
     print("=" * 50)
     
-    examples = GodelExamples()
+    examples = EXAMPLES_SINGLETON
     
     # Show all categories
     categories = examples.categories
@@ -221,26 +274,58 @@ def demo_utils():
     
     print("\n" + "=" * 50)
 
+DEMOS = (
+    demo_basic_encoding,
+    demo_decoding,
+    demo_paradoxes,
+    demo_visualizations,
+    demo_examples,
+    demo_utils,
+)
+
+def _run_one(demo):
+    """Run a demo with its output captured so concurrent demos don't interleave.
+    
+    Returns (output, error, formatted_traceback); error is None on success.
+    """
+    buffer = io.StringIO()
+    with contextlib.redirect_stdout(buffer):
+        try:
+            demo()
+        except Exception as e:
+            return buffer.getvalue(), str(e), traceback.format_exc()
+    return buffer.getvalue(), None, None
+
+def _usable_cpus():
+    """Number of CPUs this process may run on, which can be fewer than the machine has."""
+    if hasattr(os, "sched_getaffinity"):
+        return len(os.sched_getaffinity(0))
+    return os.cpu_count() or 1
+
 def main():
     """Run all demos."""
     print("Gödel Numbering Playground - Demo Mode")
     print("=" * 60)
     
-    try:
-        demo_basic_encoding()
-        demo_decoding()
-        demo_paradoxes()
-        demo_visualizations()
-        demo_examples()
-        demo_utils()
-        
-        print("\nAll demos completed successfully!")
-        print("The playground is working correctly.")
-        
-    except Exception as e:
-        print(f"\nDemo failed with error: {e}")
-        import traceback
-        traceback.print_exc()
+    # The demos are independent and CPU-bound, so run them in separate
+    # processes and print each one's captured output in order
+    cpus = _usable_cpus()
+    if cpus > 1:
+        with ProcessPoolExecutor(max_workers=min(len(DEMOS), cpus)) as executor:
+            results = list(executor.map(_run_one, DEMOS))
+    else:
+        results = map(_run_one, DEMOS)
+    
+    # Each demo's captured output goes to the terminal in a single write
+    for output, error, formatted_traceback in results:
+        sys.stdout.write(output)
+        if error is not None:
+            print(f"\nDemo failed with error: {error}")
+            print(formatted_traceback, end="", file=sys.stderr)
+            return
+    
+    print("\nAll demos completed successfully!")
+    print("The playground is working correctly.")
 
 if __name__ == "__main__":
     main()
@@ -5,160 +5,223 @@ This module contains famous mathematical statements, paradoxes, and
 progressive examples to help users understand Gödel numbering concepts.
 """
 
+from collections import defaultdict
+from functools import lru_cache
 from typing import Dict, List, Tuple
 from dataclasses import dataclass
 
 
-@dataclass
+@dataclass(frozen=True)
 class GodelExample:
     """Data structure for Gödel numbering examples."""
+    # Declared by hand rather than with slots=True to keep Python 3.8 support
+    __slots__ = ('name', 'statement', 'description', 'category', 'difficulty',
+                 'historical_context', 'learning_objectives', 'related_concepts')
+    
     name: str
     statement: str
     description: str
     category: str
     difficulty: str
     historical_context: str
-    learning_objectives: List[str]
-    related_concepts: List[str]
+    learning_objectives: Tuple[str, ...]
+    related_concepts: Tuple[str, ...]
+    
+    def __reduce__(self):
+        # Frozen slotted instances can't be restored attribute by attribute,
+        # so pickle and copy rebuild them through the constructor
+        return (self.__class__, tuple(getattr(self, name) for name in self.__slots__))
+
+
+# The examples are immutable, so they are built once at import and shared by
+# every GodelExamples instance.
+_EXAMPLES: Tuple[GodelExample, ...] = (
+    # Basic Arithmetic Examples
+    GodelExample(
+        name="Zero Equality",
+        statement="0=0",
+        description="The simplest possible arithmetic statement asserting that zero equals itself.",
+        category="Basic Arithmetic",
+        difficulty="Beginner",
+        historical_context="This represents the most fundamental arithmetic truth, often used as an axiom.",
+        learning_objectives=(
+            "Understand basic symbol encoding",
+            "See how simple statements map to numbers",
+            "Learn the role of equality in formal systems"
+        ),
+        related_concepts=("Equality", "Axioms", "Basic arithmetic")
+    ),
+
+    GodelExample(
+        name="Successor Function",
+        statement="S(0)",
+        description="The successor of zero, representing the number 1 in Peano arithmetic.",
+        category="Basic Arithmetic",
+        difficulty="Beginner",
+        historical_context="The successor function is fundamental to Peano's axiomatization of arithmetic.",
+        learning_objectives=(
+            "Learn about the successor function",
+            "Understand function notation",
+            "See how parentheses are encoded"
+        ),
+        related_concepts=("Successor function", "Peano arithmetic", "Function notation")
+    ),
+
+    GodelExample(
+        name="Simple Addition",
+        statement="0+0=0",
+        description="Basic addition statement showing how arithmetic operations are encoded.",
+        category="Basic Arithmetic",
+        difficulty="Beginner",
+        historical_context="Addition is one of the fundamental operations in arithmetic.",
+        learning_objectives=(
+            "See addition operation encoding",
+            "Understand multi-symbol statements",
+            "Learn about arithmetic operations"
+        ),
+        related_concepts=("Addition", "Arithmetic operations", "Equality")
+    ),
+
+    # Intermediate Examples
+    GodelExample(
+        name="Variable Assignment",
+        statement="x=0",
+        description="A statement assigning a value to a variable.",
+        category="Variables and Logic",
+        difficulty="Intermediate",
+        historical_context="Variables allow us to make general statements about numbers.",
+        learning_objectives=(
+            "Learn about variable encoding",
+            "Understand assignment statements",
+            "See how variables differ from constants"
+        ),
+        related_concepts=("Variables", "Assignment", "Generalization")
+    ),
+
+    GodelExample(
+        name="Universal Quantifier",
+        statement="∀x(x=x)",
+        description="A universal statement claiming that every number equals itself.",
+        category="Variables and Logic",
+        difficulty="Intermediate",
+        historical_context="Universal quantifiers are fundamental to mathematical logic.",
+        learning_objectives=(
+            "Understand universal quantification",
+            "See how quantifiers are encoded",
+            "Learn about logical structure"
+        ),
+        related_concepts=("Universal quantifier", "Logical structure", "Identity")
+    ),
+
+    # Advanced Examples
+    GodelExample(
+        name="Peano Axiom",
+        statement="∀x(S(x)≠0)",
+        description="Peano axiom stating that zero is not the successor of any number.",
+        category="Advanced Logic",
+        difficulty="Advanced",
+        historical_context="This is one of Peano's fundamental axioms for arithmetic.",
+        learning_objectives=(
+            "Understand complex logical statements",
+            "See how multiple concepts combine",
+            "Learn about axiomatic systems"
+        ),
+        related_concepts=("Peano axioms", "Complex logic", "Axiomatic systems")
+    ),
+
+    GodelExample(
+        name="Mathematical Induction",
+        statement="∀x(P(x)→P(S(x)))",
+        description="Induction step: if P holds for x, it holds for the successor of x.",
+        category="Advanced Logic",
+        difficulty="Advanced",
+        historical_context="Mathematical induction is a fundamental proof technique.",
+        learning_objectives=(
+            "Understand implication in logic",
+            "See complex quantifier structures",
+            "Learn about mathematical induction"
+        ),
+        related_concepts=("Mathematical induction", "Implication", "Complex logic")
+    )
+)
+
+# Unique categories, in order of first appearance
+_CATEGORIES: Tuple[str, ...] = tuple(dict.fromkeys(example.category for example in _EXAMPLES))
+
+# Difficulty levels from easiest to hardest
+_DIFFICULTY_ORDER: Tuple[str, ...] = ('Beginner', 'Intermediate', 'Advanced')
+
+
+def _build_indexes(examples: Tuple[GodelExample, ...]) -> Tuple[Dict, Dict, Dict]:
+    """Index examples by category, difficulty and name in a single pass."""
+    by_category = defaultdict(list)
+    by_difficulty = defaultdict(list)
+    by_name = {}
+    
+    for example in examples:
+        by_category[example.category].append(example)
+        by_difficulty[example.difficulty].append(example)
+        by_name.setdefault(example.name, example)
+    
+    return (
+        {key: tuple(value) for key, value in by_category.items()},
+        {key: tuple(value) for key, value in by_difficulty.items()},
+        by_name
+    )
+
+
+_BY_CATEGORY, _BY_DIFFICULTY, _BY_NAME = _build_indexes(_EXAMPLES)
+
+# Examples grouped from easiest to hardest
+_PROGRESSION: Dict[str, Tuple[GodelExample, ...]] = {
+    difficulty: _BY_DIFFICULTY.get(difficulty, ()) for difficulty in _DIFFICULTY_ORDER
+}
+
+# Per-category (count, distinct difficulties, example names)
+_CATEGORY_SUMMARY: Dict[str, Tuple[int, Tuple[str, ...], Tuple[str, ...]]] = {
+    category: (
+        len(examples),
+        tuple(set(example.difficulty for example in examples)),
+        tuple(example.name for example in examples)
+    )
+    for category, examples in _BY_CATEGORY.items()
+}
+
+# Lowercased searchable text per example; the unit separator keeps a query
+# from matching across two fields
+_HAYSTACKS: Tuple[str, ...] = tuple(
+    '\x1f'.join((example.name, example.description, *example.related_concepts)).lower()
+    for example in _EXAMPLES
+)
+
+
+@lru_cache(maxsize=256)
+def _search(query: str) -> Tuple[int, ...]:
+    """Indexes of the examples whose haystack contains a lowercased query."""
+    return tuple(i for i, haystack in enumerate(_HAYSTACKS) if query in haystack)
 
 
 class GodelExamples:
     """Collection of pre-built examples for Gödel numbering demonstrations."""
     
     def __init__(self):
-        self.examples = self._initialize_examples()
-        self.categories = self._get_categories()
-    
-    def _initialize_examples(self) -> List[GodelExample]:
-        """Initialize the collection of examples."""
-        return [
-            # Basic Arithmetic Examples
-            GodelExample(
-                name="Zero Equality",
-                statement="0=0",
-                description="The simplest possible arithmetic statement asserting that zero equals itself.",
-                category="Basic Arithmetic",
-                difficulty="Beginner",
-                historical_context="This represents the most fundamental arithmetic truth, often used as an axiom.",
-                learning_objectives=[
-                    "Understand basic symbol encoding",
-                    "See how simple statements map to numbers",
-                    "Learn the role of equality in formal systems"
-                ],
-                related_concepts=["Equality", "Axioms", "Basic arithmetic"]
-            ),
-            
-            GodelExample(
-                name="Successor Function",
-                statement="S(0)",
-                description="The successor of zero, representing the number 1 in Peano arithmetic.",
-                category="Basic Arithmetic",
-                difficulty="Beginner",
-                historical_context="The successor function is fundamental to Peano's axiomatization of arithmetic.",
-                learning_objectives=[
-                    "Learn about the successor function",
-                    "Understand function notation",
-                    "See how parentheses are encoded"
-                ],
-                related_concepts=["Successor function", "Peano arithmetic", "Function notation"]
-            ),
-            
-            GodelExample(
-                name="Simple Addition",
-                statement="0+0=0",
-                description="Basic addition statement showing how arithmetic operations are encoded.",
-                category="Basic Arithmetic",
-                difficulty="Beginner",
-                historical_context="Addition is one of the fundamental operations in arithmetic.",
-                learning_objectives=[
-                    "See addition operation encoding",
-                    "Understand multi-symbol statements",
-                    "Learn about arithmetic operations"
-                ],
-                related_concepts=["Addition", "Arithmetic operations", "Equality"]
-            ),
-            
-            # Intermediate Examples
-            GodelExample(
-                name="Variable Assignment",
-                statement="x=0",
-                description="A statement assigning a value to a variable.",
-                category="Variables and Logic",
-                difficulty="Intermediate",
-                historical_context="Variables allow us to make general statements about numbers.",
-                learning_objectives=[
-                    "Learn about variable encoding",
-                    "Understand assignment statements",
-                    "See how variables differ from constants"
-                ],
-                related_concepts=["Variables", "Assignment", "Generalization"]
-            ),
-            
-            GodelExample(
-                name="Universal Quantifier",
-                statement="∀x(x=x)",
-                description="A universal statement claiming that every number equals itself.",
-                category="Variables and Logic",
-                difficulty="Intermediate",
-                historical_context="Universal quantifiers are fundamental to mathematical logic.",
-                learning_objectives=[
-                    "Understand universal quantification",
-                    "See how quantifiers are encoded",
-                    "Learn about logical structure"
-                ],
-                related_concepts=["Universal quantifier", "Logical structure", "Identity"]
-            ),
-            
-            # Advanced Examples
-            GodelExample(
-                name="Peano Axiom",
-                statement="∀x(S(x)≠0)",
-                description="Peano axiom stating that zero is not the successor of any number.",
-                category="Advanced Logic",
-                difficulty="Advanced",
-                historical_context="This is one of Peano's fundamental axioms for arithmetic.",
-                learning_objectives=[
-                    "Understand complex logical statements",
-                    "See how multiple concepts combine",
-                    "Learn about axiomatic systems"
-                ],
-                related_concepts=["Peano axioms", "Complex logic", "Axiomatic systems"]
-            ),
-            
-            GodelExample(
-                name="Mathematical Induction",
-                statement="∀x(P(x)→P(S(x)))",
-                description="Induction step: if P holds for x, it holds for the successor of x.",
-                category="Advanced Logic",
-                difficulty="Advanced",
-                historical_context="Mathematical induction is a fundamental proof technique.",
-                learning_objectives=[
-                    "Understand implication in logic",
-                    "See complex quantifier structures",
-                    "Learn about mathematical induction"
-                ],
-                related_concepts=["Mathematical induction", "Implication", "Complex logic"]
-            )
-        ]
-    
-    def _get_categories(self) -> List[str]:
-        """Get unique categories from examples."""
-        return list(set(example.category for example in self.examples))
+        self.examples = _EXAMPLES
+        self.categories = _CATEGORIES
+        self._by_category = _BY_CATEGORY
+        self._by_difficulty = _BY_DIFFICULTY
+        self._by_name = _BY_NAME
     
     def get_examples_by_category(self, category: str) -> List[GodelExample]:
         """Get examples filtered by category."""
-        return [example for example in self.examples if example.category == category]
+        return list(self._by_category.get(category, ()))
     
     def get_examples_by_difficulty(self, difficulty: str) -> List[GodelExample]:
         """Get examples filtered by difficulty level."""
-        return [example for example in self.examples if example.difficulty == difficulty]
+        return list(self._by_difficulty.get(difficulty, ()))
     
     def get_example_by_name(self, name: str) -> GodelExample:
         """Get a specific example by name."""
-        for example in self.examples:
-            if example.name == name:
-                return example
-        return None
+        return self._by_name.get(name)
     
     def get_random_example(self) -> GodelExample:
         """Get a random example from the collection."""
@@ -167,37 +230,24 @@ class GodelExamples:
     
     def search_examples(self, query: str) -> List[GodelExample]:
         """Search examples by name, description, or concepts."""
-        query = query.lower()
-        results = []
-        
-        for example in self.examples:
-            if (query in example.name.lower() or 
-                query in example.description.lower() or
-                any(query in concept.lower() for concept in example.related_concepts)):
-                results.append(example)
-        
-        return results
+        return [_EXAMPLES[i] for i in _search(query.lower())]
     
     def get_learning_progression(self) -> Dict[str, List[GodelExample]]:
         """Get examples organized by learning progression."""
-        return {
-            'Beginner': self.get_examples_by_difficulty('Beginner'),
-            'Intermediate': self.get_examples_by_difficulty('Intermediate'),
-            'Advanced': self.get_examples_by_difficulty('Advanced')
-        }
+        return {difficulty: list(examples) for difficulty, examples in _PROGRESSION.items()}
     
     def get_category_summary(self) -> Dict[str, Dict]:
         """Get summary statistics for each category."""
-        summary = {}
-        
-        for category in self.categories:
-            examples = self.get_examples_by_category(category)
-            difficulties = [ex.difficulty for ex in examples]
-            
-            summary[category] = {
-                'count': len(examples),
-                'difficulties': list(set(difficulties)),
-                'examples': [ex.name for ex in examples]
+        return {
+            category: {
+                'count': count,
+                'difficulties': list(difficulties),
+                'examples': list(names)
             }
-        
-        return summary
+            for category, (count, difficulties, names) in _CATEGORY_SUMMARY.items()
+        }
+
+
+# Shared read-only collection; the example data is immutable, so one instance
+# per process is enough
+EXAMPLES_SINGLETON = GodelExamples()
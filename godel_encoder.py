@@ -6,9 +6,191 @@ to natural numbers using prime factorization, enabling self-reference in formal
 """
 
 import math
-from typing import Dict, List, Tuple, Optional
+import sys
+import threading
+from functools import cached_property, lru_cache
+from collections.abc import Container, Iterator, Mapping
+from typing import Dict, List, Optional, Tuple
 from sympy import factorint, isprime
 
+from utils import get_first_n_primes
+
+# GMP-backed integers make the prime-power products much cheaper when available
+try:
+    from gmpy2 import mpz, remove
+except ImportError:  # pragma: no cover - gmpy2 is optional
+    mpz = int
+    
+    def remove(n: int, factor: int) -> Tuple[int, int]:
+        """Divide out every factor of 'factor' from n, like gmpy2.remove."""
+        count = 0
+        quotient, remainder = divmod(n, factor)
+        while not remainder:
+            n, count = quotient, count + 1
+            quotient, remainder = divmod(n, factor)
+        return n, count
+
+
+# Number of position primes generated when the module is imported
+INITIAL_PRIME_COUNT = 32
+
+# Most positions the full encoder keeps precomputed prime powers for; later
+# positions are raised to their powers when encoded
+PRIME_POWER_TABLE_CAP = 64
+
+# Above this many factors, _product multiplies in a balanced tree
+TREE_PRODUCT_THRESHOLD = 32
+
+# Statements (and numbers) memoized per encoder by encode/decode
+CACHE_SIZE = 4096
+
+# Code given to symbols that are not in the symbol map
+UNKNOWN_SYMBOL_CODE = 67
+
+
+class _CodeTable(dict):
+    """str.translate table from symbols to codes; unknown symbols get the default code."""
+    
+    # False when some code is too large to stand in for as a character
+    translatable = True
+    
+    def __missing__(self, key: int) -> str:
+        return chr(UNKNOWN_SYMBOL_CODE)
+
+
+class _PowerTable(dict):
+    """Prime-power rows per symbol, each covering the first 'length' positions."""
+    
+    def __init__(self, rows: Dict[str, List[int]], length: int):
+        super().__init__(rows)
+        self.length = length
+
+
+def _make_code_table(symbol_map: Dict[str, int]) -> _CodeTable:
+    """
+    Build the translate table for a symbol map.
+    
+    Codes beyond the last Unicode code point cannot be written as a
+    character; the table is then left empty and marked untranslatable,
+    so lookups fall back to the symbol map itself.
+    
+    Args:
+        symbol_map: Mapping of symbols to their codes
+        
+    Returns:
+        The translate table
+    """
+    if any(code > sys.maxunicode for code in symbol_map.values()):
+        code_table = _CodeTable()
+        code_table.translatable = False
+        return code_table
+    return _CodeTable(
+        (ord(symbol), chr(code)) for symbol, code in symbol_map.items() if len(symbol) == 1
+    )
+
+
+class _LazyDetails(Mapping):
+    """
+    Encoding details for one statement, built key by key on first access.
+    
+    Reads like the plain dict encode_statement used to return, but only the
+    statement, symbols, codes and Gödel number are stored up front; the
+    'symbol_codes', 'prime_powers' and 'prime_factors' entries are computed
+    when a caller first asks for them and reused after that.
+    """
+    
+    _KEYS = ('statement', 'symbols', 'symbol_codes', 'prime_powers',
+             'prime_factors', 'godel_number')
+    
+    def __init__(self, statement: str, symbols: List[str], primes: List[int],
+                 codes: List[int], godel_number: int, known_symbols: Container,
+                 factors: List[int]):
+        self._primes = primes[:len(symbols)]
+        self._codes = codes
+        self._known_symbols = known_symbols
+        self._factors = factors
+        self._contribution_list = None
+        self._values = {
+            'statement': statement,
+            'symbols': symbols,
+            'godel_number': godel_number
+        }
+    
+    def __getitem__(self, key: str):
+        try:
+            return self._values[key]
+        except KeyError:
+            if key not in self._KEYS:
+                raise
+        value = self._values[key] = getattr(self, '_build_' + key)()
+        return value
+    
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._KEYS)
+    
+    def __len__(self) -> int:
+        return len(self._KEYS)
+    
+    def __repr__(self) -> str:
+        return repr(dict(self))
+    
+    def _contributions(self) -> List[int]:
+        """Each position's prime power as a plain int, shared by both lists."""
+        if self._contribution_list is None:
+            self._contribution_list = [int(factor) for factor in self._factors]
+            self._factors = None
+        return self._contribution_list
+    
+    def _build_symbol_codes(self) -> List[Dict]:
+        symbol_codes = []
+        for i, (symbol, prime, code, contribution) in enumerate(
+                zip(self['symbols'], self._primes, self._codes, self._contributions())):
+            symbol_info = {
+                'position': i + 1,
+                'symbol': symbol,
+                'code': code,
+                'prime': prime,
+                'power': code,
+                'contribution': contribution
+            }
+            if symbol not in self._known_symbols:
+                # Unknown symbols get UNKNOWN_SYMBOL_CODE from the code table
+                symbol_info['note'] = 'Unknown symbol'
+            symbol_codes.append(symbol_info)
+        return symbol_codes
+    
+    def _build_prime_powers(self) -> List[Dict]:
+        return [{'prime': prime, 'power': code, 'contribution': contribution}
+                for prime, code, contribution
+                in zip(self._primes, self._codes, self._contributions())]
+    
+    def _build_prime_factors(self) -> Dict[int, int]:
+        # Every position has its own prime, so each exponent is just its code
+        return dict(zip(self._primes, self._codes))
+
+
+def _product(factors: List[int]) -> int:
+    """
+    Multiply a list of prime powers.
+    
+    Long lists are multiplied pairwise in a balanced tree, so big-integer
+    multiplications see operands of similar size rather than one huge
+    running product times a small factor.
+    
+    Args:
+        factors: The numbers to multiply
+        
+    Returns:
+        Their product
+    """
+    if len(factors) <= TREE_PRODUCT_THRESHOLD:
+        return math.prod(factors)
+    
+    while len(factors) > 1:
+        factors = [factors[i] * factors[i + 1] if i + 1 < len(factors) else factors[i]
+                   for i in range(0, len(factors), 2)]
+    return factors[0]
+
 
 class GodelEncoder:
     """
@@ -18,9 +200,19 @@ class GodelEncoder:
     is the product of primes raised to powers corresponding to symbol positions.
     """
     
-    def __init__(self):
+    # Position primes shared by every encoder, grown on demand by _ensure_primes
+    _PRIMES: List[int] = get_first_n_primes(INITIAL_PRIME_COUNT)
+    
+    # Serializes table growth, since encoders are shared across app sessions
+    _GROW_LOCK = threading.RLock()
+    
+    def __init__(self, symbol_map: Optional[Dict[str, int]] = None):
+        """
+        Args:
+            symbol_map: Symbol to prime code mapping; defaults to the full symbol set
+        """
         # Symbol mapping: symbol -> prime number
-        self.symbol_map = {
+        self.symbol_map = dict(symbol_map) if symbol_map is not None else {
             '0': 2,      # Zero
             'S': 3,      # Successor function
             '+': 5,      # Addition
@@ -44,10 +236,44 @@ class GodelEncoder:
         # Reverse mapping for decoding
         self.reverse_map = {v: k for k, v in self.symbol_map.items()}
         
-        # Cache for performance
-        self._cache = {}
+        # Bumped whenever cached results are invalidated, so callers that
+        # keep derived results can tell they are stale
+        self.cache_version = 0
+        
+        # Bounded memo tables for encode_statement and decode_number
+        self._init_caches()
+        
+        # Code lookup and prime ** code tables derived from the symbol map
+        self._build_symbol_tables()
+    
+    def _init_caches(self) -> None:
+        """Create empty memo tables bound to this encoder."""
+        self._encode_cached = lru_cache(maxsize=CACHE_SIZE)(self._encode_statement)
+        self._decode_cached = lru_cache(maxsize=CACHE_SIZE)(self._decode_number)
+    
+    def __getstate__(self) -> Dict:
+        # The memo tables wrap this instance's bound methods, so they are
+        # left out and rebuilt empty for the copy or unpickled encoder
+        state = self.__dict__.copy()
+        del state['_encode_cached'], state['_decode_cached']
+        return state
+    
+    def __setstate__(self, state: Dict) -> None:
+        self.__dict__.update(state)
+        self._init_caches()
+    
+    def statement_error(self, statement: str) -> Optional[str]:
+        """
+        Check a statement before encoding it.
+        
+        Unknown symbols get UNKNOWN_SYMBOL_CODE, so any statement can be encoded.
+        
+        Returns:
+            Why the statement cannot be encoded, or None if it can
+        """
+        return None
     
-    def encode_statement(self, statement: str) -> Tuple[int, Dict]:
+    def encode_statement(self, statement: str) -> Tuple[int, Mapping]:
         """
         Encode a logical statement to its Gödel number.
         
@@ -57,89 +283,84 @@ class GodelEncoder:
         Returns:
             Tuple of (godel_number, encoding_details)
         """
-        if statement in self._cache:
-            return self._cache[statement]
-        
+        return self._encode_cached(statement)
+    
+    def _encode_statement(self, statement: str) -> Tuple[int, Mapping]:
+        """Uncached implementation of encode_statement."""
         # Clean the statement and split into symbols
         symbols = list(statement.strip())
         
-        # Get prime numbers for each position (starting from position 1)
-        primes = self._get_primes(len(symbols))
+        # Get prime numbers and prime powers for each position (starting from position 1)
+        self._ensure_prime_powers(len(symbols))
+        self._ensure_primes(len(symbols))
+        primes = self._PRIMES
+        prime_powers = self._pp
+        head = min(len(symbols), prime_powers.length)
         
-        # Encode each symbol
-        encoding_details = {
-            'statement': statement,
-            'symbols': symbols,
-            'symbol_codes': [],
-            'prime_powers': [],
-            'prime_factors': {},
-            'godel_number': 1
-        }
+        codes = self._symbol_codes(statement.strip())
+        factors = [prime_powers[symbol][i] if symbol in prime_powers
+                   else pow(mpz(primes[i]), codes[i])
+                   for i, symbol in enumerate(symbols[:head])]
+        # Positions past the table are raised to their powers directly
+        factors += [pow(mpz(primes[i]), codes[i]) for i in range(head, len(symbols))]
+        # Hand back a plain int so callers never see gmpy2 types
+        godel_number = int(_product(factors))
         
-        godel_number = 1
-        
-        for i, symbol in enumerate(symbols):
-            if symbol in self.symbol_map:
-                symbol_code = self.symbol_map[symbol]
-                prime = primes[i]
-                power = symbol_code
-                
-                encoding_details['symbol_codes'].append({
-                    'position': i + 1,
-                    'symbol': symbol,
-                    'code': symbol_code,
-                    'prime': prime,
-                    'power': power
-                })
-                
-                encoding_details['prime_powers'].append({
-                    'prime': prime,
-                    'power': power,
-                    'contribution': prime ** power
-                })
-                
-                # Update prime factorization
-                if prime in encoding_details['prime_factors']:
-                    encoding_details['prime_factors'][prime] += power
-                else:
-                    encoding_details['prime_factors'][prime] = power
-                
-                godel_number *= (prime ** power)
-            else:
-                # Unknown symbol - assign a default code
-                symbol_code = 67  # Next available prime
-                prime = primes[i]
-                power = symbol_code
-                
-                encoding_details['symbol_codes'].append({
-                    'position': i + 1,
-                    'symbol': symbol,
-                    'code': symbol_code,
-                    'prime': prime,
-                    'power': power,
-                    'note': 'Unknown symbol'
-                })
-                
-                encoding_details['prime_powers'].append({
-                    'prime': prime,
-                    'power': power,
-                    'contribution': prime ** power
-                })
-                
-                if prime in encoding_details['prime_factors']:
-                    encoding_details['prime_factors'][prime] += power
-                else:
-                    encoding_details['prime_factors'][prime] = power
-                
-                godel_number *= (prime ** power)
-        
-        encoding_details['godel_number'] = godel_number
-        
-        # Cache the result
-        self._cache[statement] = (godel_number, encoding_details)
+        # The per-symbol breakdown is only built for callers that read it
+        encoding_details = _LazyDetails(statement, symbols, primes, codes,
+                                        godel_number, self._known_symbols, factors)
         
         return godel_number, encoding_details
     
+    def encode_number(self, statement: str) -> int:
+        """
+        Compute a statement's Gödel number without the encoding details.
+        
+        Use this when only the number is needed; it skips building the
+        per-symbol breakdown that encode_statement returns.
+        
+        Args:
+            statement: The logical statement to encode
+            
+        Returns:
+            The Gödel number
+        """
+        symbols = statement.strip()
+        self._ensure_prime_powers(len(symbols))
+        self._ensure_primes(len(symbols))
+        primes = self._PRIMES
+        prime_powers = self._pp
+        head = min(len(symbols), prime_powers.length)
+        
+        factors = [prime_powers[symbol][i] if symbol in prime_powers
+                   else pow(mpz(primes[i]), UNKNOWN_SYMBOL_CODE)
+                   for i, symbol in enumerate(symbols[:head])]
+        if head < len(symbols):
+            # Positions past the table are raised to their powers directly
+            codes = self._symbol_codes(symbols[head:])
+            factors += [pow(mpz(primes[head + i]), code) for i, code in enumerate(codes)]
+        return int(_product(factors))
+    
+    def encode_log10(self, statement: str) -> float:
+        """
+        Compute log10 of a statement's Gödel number without building it.
+        
+        Summing code * log10(prime) over the positions is enough to show the
+        number's magnitude or digit count.
+        
+        Args:
+            statement: The logical statement to measure
+            
+        Returns:
+            log10 of the Gödel number
+        """
+        symbols = statement.strip()
+        self._ensure_primes(len(symbols))
+        primes = self._PRIMES
+        
+        return sum(code * math.log10(prime)
+                   for code, prime in zip(self._symbol_codes(symbols), primes))
+    
     def decode_number(self, godel_number: int) -> Tuple[str, Dict]:
         """
         Decode a Gödel number back to its original statement.
@@ -150,11 +371,13 @@ class GodelEncoder:
         Returns:
             Tuple of (decoded_statement, decoding_details)
         """
-        if godel_number in self._cache:
-            return self._cache[godel_number]
-        
-        # Factor the number
-        prime_factors = factorint(godel_number)
+        return self._decode_cached(godel_number)
+    
+    def _decode_number(self, godel_number: int) -> Tuple[str, Dict]:
+        """Uncached implementation of decode_number."""
+        # Gödel numbers are built from the first few primes, so dividing them
+        # out in order recovers the factorization without general factoring
+        prime_factors = self._factor(godel_number)
         
         # Sort primes to maintain position order
         sorted_primes = sorted(prime_factors.keys())
@@ -187,35 +410,183 @@ class GodelEncoder:
         decoded_statement = ''.join(decoded_symbols)
         decoding_details['decoded_statement'] = decoded_statement
         
-        # Cache the result
-        self._cache[godel_number] = (decoded_statement, decoding_details)
-        
         return decoded_statement, decoding_details
     
-    def _get_primes(self, count: int) -> List[int]:
+    def _factor(self, n: int) -> Dict[int, int]:
         """
-        Get the first 'count' prime numbers.
+        Factor a number by dividing out consecutive position primes.
+        
+        Gödel numbers are products of the first few primes, so this normally
+        finishes without sympy. Anything left once a position prime fails to
+        divide is handed to factorint.
+        
+        Args:
+            n: The number to factor
+            
+        Returns:
+            Dictionary mapping primes to their powers
+        """
+        if n < 2:
+            return factorint(n)
+        
+        prime_factors = {}
+        remaining = mpz(n)
+        position = 0
+        
+        while remaining > 1:
+            self._ensure_primes(position + 1)
+            prime = self._PRIMES[position]
+            remaining, power = remove(remaining, prime)
+            if not power:
+                break
+            prime_factors[prime] = int(power)
+            position += 1
+        
+        if remaining > 1:
+            prime_factors.update(factorint(int(remaining)))
+        
+        return prime_factors
+    
+    def _symbol_codes(self, symbols: str) -> List[int]:
+        """
+        Look up the code of every symbol in one str.translate pass.
+        
+        Args:
+            symbols: The statement's symbols
+            
+        Returns:
+            List of symbol codes, one per position
+        """
+        if not self._code_table.translatable:
+            # Some code is past chr()'s range, so look each symbol up instead
+            return [self.symbol_map.get(symbol, UNKNOWN_SYMBOL_CODE) for symbol in symbols]
+        return list(map(ord, symbols.translate(self._code_table)))
+    
+    def _build_symbol_tables(self, code_table: Optional[_CodeTable] = None) -> None:
+        """
+        Rebuild the code lookup and prime-power tables for the current symbol map.
+        
+        Args:
+            code_table: The translate table for the map, if already built
+        """
+        with self._GROW_LOCK:
+            self._code_table = code_table if code_table is not None else _make_code_table(self.symbol_map)
+            self._known_symbols = frozenset(self.symbol_map)
+            empty = _PowerTable({symbol: [] for symbol in self.symbol_map}, 0)
+            self._pp = self._grow_table(empty, min(self._table_length(), self._table_cap()))
+    
+    def _table_length(self) -> int:
+        """Number of positions the prime-power table is built with."""
+        return INITIAL_PRIME_COUNT
+    
+    def _table_cap(self) -> int:
+        """Most positions the prime-power table grows to."""
+        return PRIME_POWER_TABLE_CAP
+    
+    def _grow_table(self, table: _PowerTable, length: int) -> _PowerTable:
+        """
+        Return a copy of a prime-power table extended to 'length' positions.
+        
+        Args:
+            table: The table to extend
+            length: Number of positions the copy covers
+            
+        Returns:
+            The extended table
+        """
+        self._ensure_primes(length)
+        primes = self._PRIMES
+        return _PowerTable({
+            symbol: row + [pow(mpz(prime), self.symbol_map[symbol]) for prime in primes[len(row):length]]
+            for symbol, row in table.items()
+        }, length)
+    
+    def _ensure_prime_powers(self, count: int) -> None:
+        """
+        Make sure the prime-power table covers at least 'count' positions, up to the cap.
+        
+        Args:
+            count: Number of positions needed
+        """
+        cap = self._table_cap()
+        count = min(count, cap)
+        if count <= self._pp.length:
+            return
+        
+        with self._GROW_LOCK:
+            table = self._pp
+            if count <= table.length:
+                return
+            
+            # The extended copy replaces the table in one assignment, so
+            # readers always see rows that match its length
+            self._pp = self._grow_table(table, min(max(count, 2 * table.length), cap))
+    
+    @classmethod
+    def _ensure_primes(cls, count: int) -> None:
+        """
+        Make sure at least 'count' position primes are cached.
+        
+        The cache lives on GodelEncoder itself so that subclasses share it.
         
         Args:
             count: Number of primes needed
+        """
+        if count <= len(GodelEncoder._PRIMES):
+            return
+        
+        with cls._GROW_LOCK:
+            if count > len(GodelEncoder._PRIMES):
+                GodelEncoder._PRIMES = get_first_n_primes(max(count, 2 * len(GodelEncoder._PRIMES)))
+    
+    def batch_encode(self, statements: List[str]) -> List[Tuple[int, Mapping]]:
+        """
+        Encode several statements, generating the position primes only once.
+        
+        Args:
+            statements: The logical statements to encode
             
         Returns:
-            List of prime numbers
+            List of (godel_number, encoding_details) tuples in input order
+        """
+        if statements:
+            self._ensure_prime_powers(max(len(statement) for statement in statements))
+        
+        return [self.encode_statement(statement) for statement in statements]
+    
+    def encode_many(self, statements: List[str]) -> List[int]:
         """
-        primes = []
-        num = 2
+        Compute several Gödel numbers, extending the prime-power table only once.
         
-        while len(primes) < count:
-            if isprime(num):
-                primes.append(num)
-            num += 1
+        Args:
+            statements: The logical statements to encode
+            
+        Returns:
+            List of Gödel numbers in input order
+        """
+        if statements:
+            self._ensure_prime_powers(max(len(statement) for statement in statements))
         
-        return primes
+        return [self.encode_number(statement) for statement in statements]
     
     def get_symbol_table(self) -> Dict[str, int]:
         """Get the current symbol mapping table."""
         return self.symbol_map.copy()
     
+    @cached_property
+    def symbol_table_df(self):
+        """
+        Symbol mapping table as a pandas DataFrame with Symbol and Code columns.
+        
+        Built once per encoder and shared between callers, so treat it as read-only.
+        """
+        import pandas as pd
+        
+        return pd.DataFrame({
+            "Symbol": list(self.symbol_map.keys()),
+            "Code": list(self.symbol_map.values())
+        })
+    
     def add_symbol(self, symbol: str, code: int):
         """
         Add a new symbol to the encoding system.
@@ -224,16 +595,25 @@ class GodelEncoder:
             symbol: The symbol to add
             code: The prime number code for the symbol
         """
-        if isprime(code) and code not in self.reverse_map:
+        if not isprime(code) or code in self.reverse_map:
+            raise ValueError(f"Code {code} must be a unique prime number")
+        
+        # Build the new code table before touching any state, so a failure
+        # leaves the encoder as it was
+        code_table = _make_code_table({**self.symbol_map, symbol: code})
+        
+        with self._GROW_LOCK:
             self.symbol_map[symbol] = code
             self.reverse_map[code] = symbol
-            self._cache.clear()  # Clear cache when symbols change
-        else:
-            raise ValueError(f"Code {code} must be a unique prime number")
+            self.clear_cache()  # Clear cache when symbols change
+            self.__dict__.pop('symbol_table_df', None)
+            self._build_symbol_tables(code_table)
     
     def clear_cache(self):
         """Clear the encoding/decoding cache."""
-        self._cache.clear()
+        self._encode_cached.cache_clear()
+        self._decode_cached.cache_clear()
+        self.cache_version += 1
 
 
 class SimplifiedGodelEncoder(GodelEncoder):
@@ -245,10 +625,11 @@ class SimplifiedGodelEncoder(GodelEncoder):
     """
     
     def __init__(self):
-        super().__init__()
+        self.max_length = 20  # Limit statement length
         
-        # Override with smaller primes for demonstration
-        self.symbol_map = {
+        # Smaller primes for demonstration; the tables are built once, at
+        # max_length, by the base constructor
+        super().__init__({
             '0': 2,      # Zero
             'S': 3,      # Successor function
             '+': 5,      # Addition
@@ -266,12 +647,22 @@ class SimplifiedGodelEncoder(GodelEncoder):
             'x': 47,     # Variable x
             'y': 53,     # Variable y
             'z': 59,     # Variable z
-        }
-        
-        self.reverse_map = {v: k for k, v in self.symbol_map.items()}
-        self.max_length = 20  # Limit statement length
+        })
     
-    def encode_statement(self, statement: str) -> Tuple[int, Dict]:
+    def _table_length(self) -> int:
+        """Statements never exceed max_length, so the table covers exactly that many positions."""
+        return self.max_length
+    
+    def _table_cap(self) -> int:
+        return self.max_length
+    
+    def statement_error(self, statement: str) -> Optional[str]:
+        """Statements longer than max_length are rejected."""
+        if len(statement) > self.max_length:
+            return f"Statement too long. Maximum length is {self.max_length} symbols."
+        return None
+    
+    def encode_statement(self, statement: str) -> Tuple[int, Mapping]:
         """
         Encode with length limit for manageable numbers.
         
@@ -281,7 +672,58 @@ class SimplifiedGodelEncoder(GodelEncoder):
         Returns:
             Tuple of (godel_number, encoding_details)
         """
-        if len(statement) > self.max_length:
-            raise ValueError(f"Statement too long. Maximum length is {self.max_length} symbols.")
+        error = self.statement_error(statement)
+        if error:
+            raise ValueError(error)
         
         return super().encode_statement(statement)
+    
+    def encode_number(self, statement: str) -> int:
+        """
+        Compute a Gödel number with the same length limit as encode_statement.
+        
+        Args:
+            statement: The logical statement to encode
+            
+        Returns:
+            The Gödel number
+        """
+        error = self.statement_error(statement)
+        if error:
+            raise ValueError(error)
+        
+        return super().encode_number(statement)
+    
+    def batch_encode(self, statements: List[str]) -> List[Tuple[int, Mapping]]:
+        """
+        Encode several statements, checking every length before encoding any.
+        
+        Args:
+            statements: The logical statements to encode
+            
+        Returns:
+            List of (godel_number, encoding_details) tuples in input order
+        """
+        for statement in statements:
+            error = self.statement_error(statement)
+            if error:
+                raise ValueError(error)
+        
+        return super().batch_encode(statements)
+    
+    def encode_many(self, statements: List[str]) -> List[int]:
+        """
+        Compute several Gödel numbers, checking every length before encoding any.
+        
+        Args:
+            statements: The logical statements to encode
+            
+        Returns:
+            List of Gödel numbers in input order
+        """
+        for statement in statements:
+            error = self.statement_error(statement)
+            if error:
+                raise ValueError(error)
+        
+        return super().encode_many(statements)
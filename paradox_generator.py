@@ -5,10 +5,70 @@ This module demonstrates how Gödel numbering enables self-reference,
 leading to paradoxes that illustrate the incompleteness theorem.
 """
 
-from typing import Dict, List, Tuple, Optional
+import re
+from types import MappingProxyType
+from typing import Dict, List, Mapping, Tuple, Optional
 from godel_encoder import GodelEncoder
 
 
+# Keyword groups are listed in priority order: when several keywords occur,
+# the lowest-numbered group decides, whatever its position in the text
+_CLASSIFY_KEYWORDS = re.compile(r'(false)|(unprovable)|(provable)|(consistent)', re.IGNORECASE)
+_CLASSIFY_TYPES = (
+    'Truth Value Paradox',
+    'Provability Paradox',
+    'Provability Paradox',
+    'Meta-mathematical Paradox'
+)
+_INCOMPLETENESS_KEYWORDS = re.compile(r'(unprovable)|(consistent)', re.IGNORECASE)
+
+
+def _keyword_rank(pattern: re.Pattern, text: str) -> int:
+    """Lowest group number of the pattern matched anywhere in text, or 0 for none."""
+    return min((match.lastindex for match in pattern.finditer(text)), default=0)
+
+
+# Paradox templates with placeholders for self-reference, shared read-only by
+# every generator; results carry their own copy of the template
+_TEMPLATES: Mapping[str, Mapping] = MappingProxyType({name: MappingProxyType(template) for name, template in {
+    'liar_paradox': {
+        'name': 'Liar Paradox',
+        'template': 'This statement is false',
+        'description': 'A statement that cannot be consistently assigned a truth value.',
+        'godel_placeholder': 'G(THIS)',
+        'explanation': 'If the statement is true, then it must be false. If it is false, then it must be true.'
+    },
+    'quine': {
+        'name': 'Mathematical Quine',
+        'template': 'The statement with Gödel number G(THIS) is unprovable',
+        'description': 'A statement that refers to its own Gödel number.',
+        'godel_placeholder': 'G(THIS)',
+        'explanation': 'This statement claims about itself that it cannot be proven within the formal system.'
+    },
+    'provability': {
+        'name': 'Provability Paradox',
+        'template': 'The statement with Gödel number G(THIS) is provable',
+        'description': 'A statement about its own provability.',
+        'godel_placeholder': 'G(THIS)',
+        'explanation': 'This creates a paradox: if provable, it must be true, but if true, it must be provable.'
+    },
+    'truth': {
+        'name': 'Truth Paradox',
+        'template': 'The statement with Gödel number G(THIS) is true',
+        'description': 'A statement that claims its own truth.',
+        'godel_placeholder': 'G(THIS)',
+        'explanation': 'This statement refers to itself and claims to be true, creating a circular reference.'
+    },
+    'consistency': {
+        'name': 'Consistency Statement',
+        'template': 'The formal system is consistent',
+        'description': 'A statement about the consistency of the formal system itself.',
+        'godel_placeholder': None,
+        'explanation': 'Gödel showed that if a formal system is consistent, it cannot prove its own consistency.'
+    }
+}.items()})
+
+
 class ParadoxGenerator:
     """
     Generates self-referential statements and paradoxes using Gödel numbering.
@@ -19,47 +79,46 @@ class ParadoxGenerator:
     
     def __init__(self, encoder: GodelEncoder):
         self.encoder = encoder
-        self.paradox_templates = self._initialize_templates()
+        self.paradox_templates = _TEMPLATES
+        
+        # (encoder cache_version, examples) from the last get_paradox_examples
+        self._examples_cache: Optional[Tuple[int, List[Dict]]] = None
+        
+        # Gödel numbers of the placeholder templates' base statements, encoded
+        # on first use and refreshed when the encoder's cache_version changes
+        self._base_numbers_version: Optional[int] = None
+        self._base_numbers: Dict[str, int] = {}
     
-    def _initialize_templates(self) -> Dict[str, Dict]:
-        """Initialize paradox templates with placeholders for self-reference."""
-        return {
-            'liar_paradox': {
-                'name': 'Liar Paradox',
-                'template': 'This statement is false',
-                'description': 'A statement that cannot be consistently assigned a truth value.',
-                'godel_placeholder': 'G(THIS)',
-                'explanation': 'If the statement is true, then it must be false. If it is false, then it must be true.'
-            },
-            'quine': {
-                'name': 'Mathematical Quine',
-                'template': 'The statement with Gödel number G(THIS) is unprovable',
-                'description': 'A statement that refers to its own Gödel number.',
-                'godel_placeholder': 'G(THIS)',
-                'explanation': 'This statement claims about itself that it cannot be proven within the formal system.'
-            },
-            'provability': {
-                'name': 'Provability Paradox',
-                'template': 'The statement with Gödel number G(THIS) is provable',
-                'description': 'A statement about its own provability.',
-                'godel_placeholder': 'G(THIS)',
-                'explanation': 'This creates a paradox: if provable, it must be true, but if true, it must be provable.'
-            },
-            'truth': {
-                'name': 'Truth Paradox',
-                'template': 'The statement with Gödel number G(THIS) is true',
-                'description': 'A statement that claims its own truth.',
-                'godel_placeholder': 'G(THIS)',
-                'explanation': 'This statement refers to itself and claims to be true, creating a circular reference.'
-            },
-            'consistency': {
-                'name': 'Consistency Statement',
-                'template': 'The formal system is consistent',
-                'description': 'A statement about the consistency of the formal system itself.',
-                'godel_placeholder': None,
-                'explanation': 'Gödel showed that if a formal system is consistent, it cannot prove its own consistency.'
+    def _get_base_numbers(self) -> Dict[str, int]:
+        """
+        Get the base-statement Gödel numbers of the placeholder templates.
+        
+        Templates the encoder rejects (for example, ones longer than a
+        simplified encoder allows) are left out, so generating them reports
+        the encoder's error as usual.
+        """
+        if self._base_numbers_version != self.encoder.cache_version:
+            base_statements = {
+                template_name: template['template'].replace(template['godel_placeholder'], '')
+                for template_name, template in self.paradox_templates.items()
+                if template['godel_placeholder'] and template['godel_placeholder'] in template['template']
             }
-        }
+            
+            try:
+                numbers = self.encoder.encode_many(list(base_statements.values()))
+                self._base_numbers = dict(zip(base_statements, numbers))
+            except ValueError:
+                # Some template was rejected; keep the ones that do encode
+                self._base_numbers = {}
+                for template_name, base_statement in base_statements.items():
+                    try:
+                        self._base_numbers[template_name] = self.encoder.encode_number(base_statement)
+                    except ValueError:
+                        pass
+            
+            self._base_numbers_version = self.encoder.cache_version
+        
+        return self._base_numbers
     
     def generate_self_referential_statement(self, template_name: str, custom_text: str = None) -> Dict:
         """
@@ -88,14 +147,19 @@ class ParadoxGenerator:
         # Generate the statement without self-reference first
         base_statement = statement.replace(template['godel_placeholder'], '') if has_placeholder else statement
         
-        # Encode the base statement
+        # Encode the base statement; with a placeholder only its number is needed
         try:
-            godel_number, encoding_details = self.encoder.encode_statement(base_statement)
+            if has_placeholder:
+                godel_number = None if custom_text else self._get_base_numbers().get(template_name)
+                if godel_number is None:
+                    godel_number = self.encoder.encode_number(base_statement)
+            else:
+                godel_number, encoding_details = self.encoder.encode_statement(base_statement)
         except Exception as e:
             return {
                 'error': str(e),
                 'template_name': template_name,
-                'template': template,
+                'template': dict(template),
                 'custom_text': custom_text
             }
         
@@ -121,7 +185,7 @@ class ParadoxGenerator:
         
         return {
             'template_name': template_name,
-            'template': template,
+            'template': dict(template),
             'base_statement': base_statement,
             'base_godel_number': godel_number,
             'self_referential_statement': self_referential_statement,
@@ -133,16 +197,8 @@ class ParadoxGenerator:
     
     def _classify_paradox(self, template_name: str, statement: str) -> str:
         """Classify the type of paradox generated."""
-        if 'false' in statement.lower():
-            return 'Truth Value Paradox'
-        elif 'unprovable' in statement.lower():
-            return 'Provability Paradox'
-        elif 'provable' in statement.lower():
-            return 'Provability Paradox'
-        elif 'consistent' in statement.lower():
-            return 'Meta-mathematical Paradox'
-        else:
-            return 'Self-Reference Paradox'
+        rank = _keyword_rank(_CLASSIFY_KEYWORDS, statement)
+        return _CLASSIFY_TYPES[rank - 1] if rank else 'Self-Reference Paradox'
     
     def create_custom_paradox(self, statement: str, placeholder: str = 'G(THIS)') -> Dict:
         """
@@ -164,7 +220,7 @@ class ParadoxGenerator:
         base_statement = statement.replace(placeholder, '')
         
         try:
-            godel_number, encoding_details = self.encoder.encode_statement(base_statement)
+            godel_number = self.encoder.encode_number(base_statement)
         except Exception as e:
             return {
                 'error': str(e),
@@ -199,7 +255,21 @@ class ParadoxGenerator:
         }
     
     def get_paradox_examples(self) -> List[Dict]:
-        """Get all available paradox examples."""
+        """
+        Get all available paradox examples.
+        
+        The examples are generated once and reused until the encoder's
+        cached results are invalidated (see GodelEncoder.cache_version).
+        """
+        version = self.encoder.cache_version
+        if self._examples_cache is None or self._examples_cache[0] != version:
+            self._examples_cache = (version, self._generate_paradox_examples())
+        
+        return [dict(example, template=dict(example['template']))
+                for example in self._examples_cache[1]]
+    
+    def _generate_paradox_examples(self) -> List[Dict]:
+        """Generate an example for every template."""
         examples = []
         
         for template_name, template in self.paradox_templates.items():
@@ -210,7 +280,7 @@ class ParadoxGenerator:
             except Exception as e:
                 examples.append({
                     'template_name': template_name,
-                    'template': template,
+                    'template': dict(template),
                     'error': str(e)
                 })
         
@@ -270,7 +340,8 @@ class ParadoxGenerator:
     
     def _explain_incompleteness_connection(self, paradox_data: Dict) -> str:
         """Explain how this paradox connects to Gödel's incompleteness theorem."""
-        if 'unprovable' in paradox_data.get('self_referential_statement', '').lower():
+        rank = _keyword_rank(_INCOMPLETENESS_KEYWORDS, paradox_data.get('self_referential_statement', ''))
+        if rank == 1:
             return """
             This paradox directly demonstrates Gödel's First Incompleteness Theorem:
             - The statement claims it cannot be proven
@@ -278,7 +349,7 @@ class ParadoxGenerator:
             - If the system cannot prove it, the statement is true but unprovable
             - Therefore, the formal system is incomplete
             """
-        elif 'consistent' in paradox_data.get('self_referential_statement', '').lower():
+        elif rank == 2:
             return """
             This connects to Gödel's Second Incompleteness Theorem:
             - A consistent formal system cannot prove its own consistency
@@ -40,6 +40,11 @@ setup(
             "flake8>=3.8",
             "mypy>=0.800",
         ],
+        "fast": [
+            "gmpy2>=2.1",
+            "numba>=0.56",
+            "orjson>=3.9",
+        ],
     },
     entry_points={
         "console_scripts": [
@@ -3,32 +3,29 @@ Test script to verify all modules work correctly.
 Run this to check if the Gödel numbering playground is properly set up.
 """
 
+from importlib.util import find_spec
+
 def test_imports():
-    """Test that all modules can be imported successfully."""
+    """Test that all modules can be found without importing them."""
     try:
         print("🔍 Testing module imports...")
         
-        from godel_encoder import GodelEncoder, SimplifiedGodelEncoder
-        print("godel_encoder imported successfully")
-        
-        from paradox_generator import ParadoxGenerator
-        print("paradox_generator imported successfully")
-        
-        from visualizer import GodelVisualizer
-        print("visualizer imported successfully")
-        
-        from examples import GodelExamples
-        print("examples imported successfully")
+        # find_spec only locates each module, so this stays fast; the modules
+        # themselves are imported where test_basic_functionality uses them
+        modules = ('godel_encoder', 'paradox_generator', 'visualizer', 'examples', 'utils',
+                   'streamlit', 'plotly', 'pandas', 'sympy')
+        missing = [name for name in modules if find_spec(name) is None]
+        for name in modules:
+            if name not in missing:
+                print(f"{name} found successfully")
         
-        import utils
-        print("utils imported successfully")
+        if missing:
+            print(f"Import error: missing {', '.join(missing)}")
+            return False
         
-        print("\nAll modules imported successfully!")
+        print("\nAll modules found successfully!")
         return True
         
-    except ImportError as e:
-        print(f"Import error: {e}")
-        return False
     except Exception as e:
         print(f"Unexpected error: {e}")
         return False
@@ -91,6 +88,159 @@ def test_basic_functionality():
         traceback.print_exc()
         return False
 
+def test_batch_and_number_encoding():
+    """Test that batch and number-only encoding agree with encode_statement."""
+    print("\nTesting batch and number-only encoding...")
+    
+    from godel_encoder import SimplifiedGodelEncoder
+    encoder = SimplifiedGodelEncoder()
+    statements = ["0=0", "S(0)"]
+    
+    batch_results = encoder.batch_encode(statements)
+    assert [number for number, _ in batch_results] == [encoder.encode_statement(s)[0] for s in statements]
+    print(f"Batch encoded {len(batch_results)} statements")
+    
+    assert encoder.encode_number("S(0)") == batch_results[1][0]
+    assert encoder.encode_many(statements) == [number for number, _ in batch_results]
+    print("Number-only encoding matches full encoding")
+
+def test_encoding_details():
+    """Test that the lazily built encoding details match the plain dict they replace."""
+    print("\nTesting encoding details...")
+    
+    from godel_encoder import GodelEncoder
+    encoder = GodelEncoder()
+    
+    # 'x' and '=' are known symbols, '?' gets the unknown-symbol code 67
+    godel_number, details = encoder.encode_statement("x=?")
+    symbol_codes = [
+        {'position': 1, 'symbol': 'x', 'code': 47, 'prime': 2, 'power': 47, 'contribution': 2**47},
+        {'position': 2, 'symbol': '=', 'code': 11, 'prime': 3, 'power': 11, 'contribution': 3**11},
+        {'position': 3, 'symbol': '?', 'code': 67, 'prime': 5, 'power': 67, 'contribution': 5**67,
+         'note': 'Unknown symbol'},
+    ]
+    expected = {
+        'statement': "x=?",
+        'symbols': ['x', '=', '?'],
+        'symbol_codes': symbol_codes,
+        'prime_powers': [{key: info[key] for key in ('prime', 'power', 'contribution')}
+                         for info in symbol_codes],
+        'prime_factors': {2: 47, 3: 11, 5: 67},
+        'godel_number': 2**47 * 3**11 * 5**67,
+    }
+    
+    assert godel_number == expected['godel_number']
+    assert details == expected
+    assert list(details) == list(expected)
+    assert details['symbol_codes'] is details['symbol_codes']
+    print("Encoding details match the dict format")
+
+def test_factor_cofactor_fallback():
+    """Test that factors beyond the consecutive position primes are still found."""
+    print("\nTesting factorization fallback...")
+    
+    from godel_encoder import GodelEncoder
+    encoder = GodelEncoder()
+    
+    # 5 is skipped, so 7 is left for sympy
+    assert encoder._factor(2**3 * 3**2 * 7) == {2: 3, 3: 2, 7: 1}
+    # A cofactor that is not a position prime at all
+    assert encoder._factor(2 * 3 * 1000003) == {2: 1, 3: 1, 1000003: 1}
+    # No position primes, and numbers below 2
+    assert encoder._factor(1000003**2) == {1000003: 2}
+    assert encoder._factor(1) == {}
+    print("Cofactors are handed to factorint")
+
+def test_keyword_rank_priority():
+    """Test that keyword ranking follows pattern order, not position in the text."""
+    print("\nTesting paradox keyword ranking...")
+    
+    from paradox_generator import _CLASSIFY_KEYWORDS, _INCOMPLETENESS_KEYWORDS, _keyword_rank
+    
+    assert _keyword_rank(_CLASSIFY_KEYWORDS, "This is provable but FALSE") == 1
+    assert _keyword_rank(_CLASSIFY_KEYWORDS, "consistent yet unprovable") == 2
+    assert _keyword_rank(_CLASSIFY_KEYWORDS, "a consistent system") == 4
+    assert _keyword_rank(_CLASSIFY_KEYWORDS, "nothing to see here") == 0
+    assert _keyword_rank(_INCOMPLETENESS_KEYWORDS, "consistent and unprovable") == 1
+    print("Keywords are ranked by priority")
+
+def test_size_ratio():
+    """Test big-number size ratio formatting."""
+    print("\nTesting size ratio formatting...")
+    
+    from utils import format_size_ratio
+    
+    assert format_size_ratio(10, 4) == "2.5"
+    # Numbers wider than 64 bits are compared by their leading bits
+    assert format_size_ratio(3 * 2**2000, 2**2000) == "3.0"
+    # Ratios too large for a float fall back to a power of ten
+    assert format_size_ratio(10**400, 1) == "10^400"
+    print("Size ratios are formatted correctly")
+
+def test_add_symbol_large_code():
+    """Test that symbols with codes past the last Unicode code point still encode."""
+    print("\nTesting symbols with large codes...")
+    
+    from godel_encoder import GodelEncoder
+    encoder = GodelEncoder()
+    
+    # 1114117 is prime and larger than sys.maxunicode, so chr() cannot hold it
+    encoder.add_symbol('q', 1114117)
+    assert encoder.symbol_map['q'] == 1114117
+    assert encoder.encode_number("q0") == 2**1114117 * 3**2
+    assert encoder.encode_statement("q0")[1]['symbol_codes'][0]['code'] == 1114117
+    assert encoder.encode_number("0=0") == GodelEncoder().encode_number("0=0")
+    print("Large codes fall back to symbol map lookups")
+
+def test_concurrent_table_growth():
+    """Test that threads sharing an encoder grow its prime-power table consistently."""
+    print("\nTesting concurrent table growth...")
+    
+    import threading
+    from godel_encoder import GodelEncoder, PRIME_POWER_TABLE_CAP
+    shared = GodelEncoder()
+    statements = ['x=0' * count for count in (20, 50, 90, 150, 300)]
+    expected = [GodelEncoder().encode_number(statement) for statement in statements]
+    results = [None] * len(statements)
+    
+    def encode(index):
+        results[index] = shared.encode_number(statements[index])
+    
+    threads = [threading.Thread(target=encode, args=(i,)) for i in range(len(statements))]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    
+    assert results == expected
+    assert all(len(row) == shared._pp.length for row in shared._pp.values())
+    # Long statements encode past the table instead of growing it without bound
+    assert shared._pp.length <= PRIME_POWER_TABLE_CAP
+    print("Shared encoder stayed consistent across threads")
+
+def test_encoder_copy_and_pickle():
+    """Test that copied and unpickled encoders keep their own memo tables."""
+    print("\nTesting encoder copy and pickle round trips...")
+    
+    import copy
+    import pickle
+    from godel_encoder import GodelEncoder, SimplifiedGodelEncoder
+    
+    for encoder in (GodelEncoder(), SimplifiedGodelEncoder()):
+        number, _ = encoder.encode_statement("0=0")
+        restored = pickle.loads(pickle.dumps(encoder))
+        assert restored.encode_statement("0=0")[0] == number
+        assert restored.decode_number(number)[0] == "0=0"
+    
+    # 'w' is unknown, so it is cached with the default code 67 until added
+    original = GodelEncoder()
+    assert original.encode_statement("w")[0] == 2**67
+    duplicate = copy.deepcopy(original)
+    duplicate.add_symbol('w', 71)
+    assert duplicate.encode_statement("w")[0] == 2**71
+    assert original.encode_statement("w")[0] == 2**67
+    print("Copies encode with their own symbol maps")
+
 def test_streamlit_ready():
     """Test if the app is ready to run with Streamlit."""
     try:
@@ -119,6 +269,29 @@ def test_streamlit_ready():
         print(f"Unexpected error: {e}")
         return False
 
+# Checks that fail by raising, reported alongside the tests above
+CHECKS = (
+    ("Batch Encoding", test_batch_and_number_encoding),
+    ("Encoding Details", test_encoding_details),
+    ("Factorization Fallback", test_factor_cofactor_fallback),
+    ("Keyword Ranking", test_keyword_rank_priority),
+    ("Size Ratio", test_size_ratio),
+    ("Large Symbol Codes", test_add_symbol_large_code),
+    ("Concurrent Table Growth", test_concurrent_table_growth),
+    ("Copy and Pickle", test_encoder_copy_and_pickle),
+)
+
+def _run_check(check):
+    """Run a raising check and report whether it passed."""
+    try:
+        check()
+        return True
+    except Exception as e:
+        print(f"Check failed: {e!r}")
+        import traceback
+        traceback.print_exc()
+        return False
+
 def main():
     """Run all tests."""
     print("Gödel Numbering Playground - Module Test Suite")
@@ -130,14 +303,17 @@ def main():
     if imports_ok:
         functionality_ok = test_basic_functionality()
         streamlit_ok = test_streamlit_ready()
+        check_results = [(name, _run_check(check)) for name, check in CHECKS]
         
         print("\n" + "=" * 60)
         print("Test Results Summary:")
         print(f"   Module Imports: {'PASS' if imports_ok else 'FAIL'}")
         print(f"   Basic Functionality: {'PASS' if functionality_ok else 'FAIL'}")
         print(f"   Streamlit Ready: {'PASS' if streamlit_ok else 'FAIL'}")
+        for name, ok in check_results:
+            print(f"   {name}: {'PASS' if ok else 'FAIL'}")
         
-        if all([imports_ok, functionality_ok, streamlit_ok]):
+        if all([imports_ok, functionality_ok, streamlit_ok] + [ok for _, ok in check_results]):
             print("\nAll tests passed! The playground is ready to run.")
             print("Run: streamlit run app.py")
         else:
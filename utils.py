@@ -7,46 +7,81 @@ and other mathematical operations needed for the playground.
 
 import math
 from typing import List, Dict
-from sympy import isprime
 
+import numpy as np
+
+# Limits at least this large are sieved by Numba-compiled code when numba is
+# installed; below it the bytearray sieve finishes before numba could import
+NUMBA_SIEVE_THRESHOLD = 5_000_000
+
+# The compiled sieve, built on first use past the threshold; False when numba
+# is not installed
+_compiled_sieve = None
+
+
+def _sieve_array(limit):
+    """Array of the primes up to and including limit (compiled with Numba)."""
+    is_prime = np.ones(limit + 1, dtype=np.bool_)
+    is_prime[:2] = False
+    for i in range(2, int(np.sqrt(limit)) + 1):
+        if is_prime[i]:
+            is_prime[i * i::i] = False
+    return np.flatnonzero(is_prime)
+
+
+def _get_compiled_sieve():
+    """Import numba and compile _sieve_array on first call, or return None without numba."""
+    global _compiled_sieve
+    if _compiled_sieve is None:
+        try:
+            from numba import njit
+        except ImportError:  # pragma: no cover - numba is optional
+            _compiled_sieve = False
+        else:
+            _compiled_sieve = njit(cache=True)(_sieve_array)
+    return _compiled_sieve or None
+
+
+def _sieve(limit: int) -> List[int]:
+    """Primes up to and including limit."""
+    if limit >= NUMBA_SIEVE_THRESHOLD:
+        compiled_sieve = _get_compiled_sieve()
+        if compiled_sieve is not None:
+            return compiled_sieve(limit).tolist()
+    
+    sieve = bytearray(b"\x01") * (limit + 1)
+    sieve[:2] = b"\x00\x00"
+    for i in range(2, math.isqrt(limit) + 1):
+        if sieve[i]:
+            sieve[i * i::i] = bytes(len(range(i * i, limit + 1, i)))
+    return [i for i, is_prime in enumerate(sieve) if is_prime]
 
 
+# Primes below _sieve_limit, extended geometrically as more are requested
+_prime_cache: List[int] = []
+_sieve_limit = 0
 
 
 def get_first_n_primes(n: int) -> List[int]:
     """
     Get the first n prime numbers.
     
+    Uses a sieve of Eratosthenes whose results are cached for the process,
+    so repeated calls only slice the cached list.
+    
     Args:
         n: Number of primes to get
         
     Returns:
         List of the first n prime numbers
     """
-    primes = []
-    num = 2
+    global _prime_cache, _sieve_limit
     
-    while len(primes) < n:
-        if isprime(num):
-            primes.append(num)
-        num += 1
+    while len(_prime_cache) < n:
+        _sieve_limit = max(2 * _sieve_limit, int(n * math.log(n) * 1.3) + 15)
+        _prime_cache = _sieve(_sieve_limit)
     
-    return primes
-
-
-
-
-
-
-
-
-
-
-
-
-
-
-
+    return _prime_cache[:max(n, 0)]
 
 
 def estimate_godel_number_size(statement_length: int, avg_symbol_code: int = 30) -> Dict:
@@ -60,23 +95,23 @@ def estimate_godel_number_size(statement_length: int, avg_symbol_code: int = 30)
     Returns:
         Dictionary with size estimates
     """
-    # Rough estimate: product of first n primes raised to average symbol code
+    # Rough estimate: product of first n primes raised to average symbol code,
+    # summed in log space so the number itself is never built
     primes = get_first_n_primes(statement_length)
+    log_estimate = float(avg_symbol_code * np.log10(np.asarray(primes, dtype=np.float64)).sum())
     
-    # Calculate rough estimate
-    rough_estimate = 1
-    for prime in primes:
-        rough_estimate *= (prime ** avg_symbol_code)
-    
-    # Calculate logarithms for better understanding
-    log_estimate = math.log10(rough_estimate)
+    # Split into mantissa and exponent so huge estimates still format
+    exponent = math.floor(log_estimate)
+    mantissa = round(10 ** (log_estimate - exponent), 2)
+    if mantissa >= 10:
+        mantissa, exponent = mantissa / 10, exponent + 1
     
     return {
         'statement_length': statement_length,
         'primes_used': primes,
-        'rough_estimate': rough_estimate,
+        'rough_estimate': 10 ** log_estimate if log_estimate < 308 else math.inf,
         'log_estimate': log_estimate,
-        'scientific_notation': f"{rough_estimate:.2e}" if rough_estimate < 1e308 else "overflow",
+        'scientific_notation': f"{mantissa:.2f}e{exponent:+03d}",
         'digits': int(log_estimate) + 1
     }
 
@@ -90,6 +125,28 @@ def estimate_godel_number_size(statement_length: int, avg_symbol_code: int = 30)
 
 
 
+def format_size_ratio(larger: int, smaller: int) -> str:
+    """
+    Format larger / smaller without a full big-integer division.
+    
+    Args:
+        larger: The numerator
+        smaller: The denominator
+        
+    Returns:
+        The ratio to one decimal place, or as a power of ten when it is too
+        large for a float
+    """
+    # Divide the leading 64 bits of each number and scale by the bit-length gap
+    shift_larger = max(larger.bit_length() - 64, 0)
+    shift_smaller = max(smaller.bit_length() - 64, 0)
+    mantissa = (larger >> shift_larger) / (smaller >> shift_smaller)
+    try:
+        return f"{math.ldexp(mantissa, shift_larger - shift_smaller):.1f}"
+    except OverflowError:
+        return f"10^{math.log10(larger) - math.log10(smaller):.0f}"
+
+
 def create_demo_statements() -> List[str]:
     """
     Create a list of demo statements for quick testing.
@@ -3,11 +3,176 @@ Visualizer - Prime factorization and visual components for Gödel numbering.
 
 This module provides interactive visualizations of the encoding/decoding process,
 including prime factorization trees, symbol mappings, and educational diagrams.
+
+Figures are serialized with orjson when it is installed (pip install
+godel-playground[fast]); Streamlit and plotly's to_json pick it up on their
+own, and plain json is used otherwise.
 """
 
-import plotly.graph_objects as go
-from typing import Dict
-import math
+import functools
+import heapq
+import itertools
+from importlib.util import find_spec
+import numpy as np
+from typing import TYPE_CHECKING, Dict, Iterable, Tuple
+
+# plotly is slow to import, so each function that builds a figure imports it
+if TYPE_CHECKING:
+    import plotly.graph_objects as go
+
+# orjson serializes figures several times faster than the json module
+JSON_ENGINE = 'orjson' if find_spec('orjson') is not None else 'json'
+
+
+@functools.lru_cache(maxsize=4096)
+def _ppow(prime: int, power: int) -> int:
+    """Return prime**power, memoized since the same factors recur across trees."""
+    return prime**power
+
+
+def _balanced_product(values: Iterable[int]) -> int:
+    """
+    Multiply big integers, always combining the two smallest partial products.
+    
+    Keeping the operands close in size lets the big-int multiplication use
+    its faster algorithms instead of repeatedly multiplying a huge
+    accumulator by a small factor.
+    """
+    order = itertools.count()
+    heap = [(value.bit_length(), next(order), value) for value in values]
+    if not heap:
+        return 1
+    heapq.heapify(heap)
+    while len(heap) > 1:
+        _, _, a = heapq.heappop(heap)
+        _, _, b = heapq.heappop(heap)
+        product = a * b
+        heapq.heappush(heap, (product.bit_length(), next(order), product))
+    return heap[0][2]
+
+
+def _fmt(n: int) -> str:
+    """Format n with digit grouping, abbreviating numbers too long to read in a node label."""
+    digits = str(n)
+    if len(digits) <= 18:
+        return f"{n:,}"
+    return f"{digits[:6]}…{digits[-4:]} ({len(digits)} digits)"
+
+
+@functools.lru_cache(maxsize=128)
+def _prime_factorization_tree_spec(factors: Tuple[Tuple[int, int], ...], title: str) -> dict:
+    """
+    Build the prime factorization tree as a plain figure dictionary.
+    
+    Cached on the (prime, power) pairs so repeated statements skip the
+    layout and trace construction; callers wrap the result in a new Figure.
+    """
+    import plotly.graph_objects as go
+    
+    prime_factors = dict(factors)
+    
+    # Calculate positions for tree nodes: the root, then a prime node and
+    # its power node for each factor, one column apart
+    k = len(prime_factors)
+    columns = 2 * np.arange(k) - k  # (i - k/2) * 2, kept in integers
+    x_positions = np.concatenate(([0.0], np.repeat(columns, 2))).tolist()
+    y_positions = np.concatenate(([0.0], np.tile([-1.0, -2.0], k))).tolist()
+    
+    # Each prime power is computed once and shared by the labels and the product
+    contribs = {prime: _ppow(prime, power) for prime, power in prime_factors.items()}
+    
+    # Create tree layout. Labels stay short and the full values only appear
+    # on hover; parent_idx holds each node's parent position, -1 for the root
+    labels = []
+    hover_labels = []
+    parent_idx = []
+    
+    # Root node (Gödel number)
+    godel = _balanced_product(contribs.values())
+    labels.append("Gödel Number")
+    hover_labels.append(f"Gödel Number<br>{_fmt(godel)}")
+    parent_idx.append(-1)
+    
+    for prime, power in prime_factors.items():
+        # Prime factor nodes hang off the root
+        labels.append(f"Prime: {prime}")
+        hover_labels.append(f"Prime: {prime}<br>Power: {power}<br>Contribution: {_fmt(contribs[prime])}")
+        parent_idx.append(0)
+        
+        # Power detail nodes hang off the prime node just added
+        labels.append(f"{prime}^{power}")
+        hover_labels.append(f"{prime}^{power} = {_fmt(contribs[prime])}")
+        parent_idx.append(len(parent_idx) - 1)
+    
+    # Create tree edges straight from the parent indices. Every node but the
+    # root has one edge, drawn as (parent, child, None) in preallocated lists
+    edge_x = [None] * (3 * (len(parent_idx) - 1))
+    edge_y = [None] * (3 * (len(parent_idx) - 1))
+    
+    for child in range(1, len(parent_idx)):
+        parent = parent_idx[child]
+        base = 3 * (child - 1)
+        edge_x[base] = x_positions[parent]
+        edge_x[base + 1] = x_positions[child]
+        edge_y[base] = y_positions[parent]
+        edge_y[base + 1] = y_positions[child]
+    
+    # Edges
+    edge_trace = dict(
+        type='scattergl',
+        x=edge_x, y=edge_y,
+        mode='lines',
+        line=dict(color='gray', width=2),
+        showlegend=False,
+        hoverinfo='none'
+    )
+    
+    # Nodes
+    node_trace = dict(
+        type='scattergl',
+        x=x_positions, y=y_positions,
+        mode='markers+text',
+        text=labels,
+        hovertext=hover_labels,
+        textposition="middle center",
+        marker=dict(
+            size=20,
+            color=['#9467bd'] + ['#ff7f0e'] * k + ['#2ca02c'] * k,
+            line=dict(color='white', width=2)
+        ),
+        showlegend=False,
+        hoverinfo='text'
+    )
+    
+    layout = dict(
+        title=title,
+        showlegend=False,
+        xaxis=dict(showgrid=False, zeroline=False, showticklabels=False),
+        yaxis=dict(showgrid=False, zeroline=False, showticklabels=False),
+        plot_bgcolor='white',
+        height=500
+    )
+    
+    # Build and validate the figure in one pass rather than trace by trace
+    return go.Figure({'data': [edge_trace, node_trace], 'layout': layout}).to_dict()
+
+
+@functools.lru_cache(maxsize=32)
+def _empty_figure_spec(message: str) -> dict:
+    """Build the placeholder figure shown when there is nothing to plot, as a plain dictionary."""
+    import plotly.graph_objects as go
+    
+    return go.Figure({'layout': dict(
+        annotations=[dict(
+            x=0.5, y=0.5,
+            text=message,
+            showarrow=False,
+            font=dict(size=16, color='gray')
+        )],
+        xaxis=dict(showgrid=False, zeroline=False, showticklabels=False),
+        yaxis=dict(showgrid=False, zeroline=False, showticklabels=False),
+        plot_bgcolor='white'
+    )}).to_dict()
 
 
 class GodelVisualizer:
@@ -28,7 +193,7 @@ class GodelVisualizer:
         }
     
     def create_prime_factorization_tree(self, prime_factors: Dict[int, int], 
-                                      title: str = "Prime Factorization Tree") -> go.Figure:
+                                      title: str = "Prime Factorization Tree") -> "go.Figure":
         """
         Create an interactive tree visualization of prime factorization.
         
@@ -42,110 +207,33 @@ class GodelVisualizer:
         if not prime_factors:
             return self._create_empty_figure("No prime factors to display")
         
-        # Create tree structure
-        fig = go.Figure()
-        
-        # Calculate positions for tree nodes
-        primes = list(prime_factors.keys())
-        powers = list(prime_factors.values())
+        import plotly.graph_objects as go
         
-        # Create tree layout
-        y_positions = []
-        x_positions = []
-        labels = []
-        parents = []
-        
-        # Root node (Gödel number)
-        root_label = f"Gödel Number<br>{math.prod(p**power for p, power in prime_factors.items()):,}"
-        y_positions.append(0)
-        x_positions.append(0)
-        labels.append(root_label)
-        parents.append("")
+        # The cached spec was validated when it was first built, so skip
+        # re-validating it; the new Figure owns its own copy of the data
+        spec = _prime_factorization_tree_spec(tuple(prime_factors.items()), title)
+        return go.Figure(spec, _validate=False)
+    
+    def create_prime_factorization_tree_json(self, prime_factors: Dict[int, int],
+                                             title: str = "Prime Factorization Tree") -> str:
+        """
+        Serialize the prime factorization tree to a JSON string for the browser.
         
-        # Prime factor nodes
-        for i, (prime, power) in enumerate(prime_factors.items()):
-            y_positions.append(-1)
-            x_positions.append((i - len(primes)/2) * 2)
-            labels.append(f"Prime: {prime}<br>Power: {power}<br>Contribution: {prime**power:,}")
-            parents.append(root_label)
+        Args:
+            prime_factors: Dictionary mapping primes to their powers
+            title: Title for the visualization
             
-            # Power detail nodes
-            y_positions.append(-2)
-            x_positions.append((i - len(primes)/2) * 2)
-            labels.append(f"{prime}^{power} = {prime**power:,}")
-            parents.append(f"Prime: {prime}<br>Power: {power}<br>Contribution: {prime**power:,}")
-        
-        # Create tree edges
-        edge_x = []
-        edge_y = []
-        
-        for i, parent in enumerate(parents):
-            if parent:
-                # Find parent index
-                parent_idx = labels.index(parent)
-                edge_x.extend([x_positions[parent_idx], x_positions[i], None])
-                edge_y.extend([y_positions[parent_idx], y_positions[i], None])
-        
-        # Add edges
-        fig.add_trace(go.Scatter(
-            x=edge_x, y=edge_y,
-            mode='lines',
-            line=dict(color='gray', width=2),
-            showlegend=False,
-            hoverinfo='none'
-        ))
-        
-        # Add nodes
-        fig.add_trace(go.Scatter(
-            x=x_positions, y=y_positions,
-            mode='markers+text',
-            text=labels,
-            textposition="middle center",
-            marker=dict(
-                size=20,
-                color=['#9467bd'] + ['#ff7f0e'] * len(primes) + ['#2ca02c'] * len(primes),
-                line=dict(color='white', width=2)
-            ),
-            showlegend=False,
-            hoverinfo='text'
-        ))
-        
-        # Update layout
-        fig.update_layout(
-            title=title,
-            showlegend=False,
-            xaxis=dict(showgrid=False, zeroline=False, showticklabels=False),
-            yaxis=dict(showgrid=False, zeroline=False, showticklabels=False),
-            plot_bgcolor='white',
-            height=500
-        )
-        
-        return fig
-    
-
-    
-
-    
-
-    
-
+        Returns:
+            The figure as JSON, encoded with orjson when it is installed
+        """
+        fig = self.create_prime_factorization_tree(prime_factors, title)
+        return fig.to_json(engine=JSON_ENGINE)
     
 
-    
-    def _create_empty_figure(self, message: str) -> go.Figure:
+    def _create_empty_figure(self, message: str) -> "go.Figure":
         """Create an empty figure with a message."""
-        fig = go.Figure()
-        fig.add_annotation(
-            x=0.5, y=0.5,
-            text=message,
-            showarrow=False,
-            font=dict(size=16, color='gray')
-        )
-        fig.update_layout(
-            xaxis=dict(showgrid=False, zeroline=False, showticklabels=False),
-            yaxis=dict(showgrid=False, zeroline=False, showticklabels=False),
-            plot_bgcolor='white'
-        )
-        return fig
+        import plotly.graph_objects as go
+        
+        return go.Figure(_empty_figure_spec(message), _validate=False)
     
 